@@ -1,26 +1,45 @@
 """Other Us — FastAPI application entry point."""
+import logging
 from contextlib import asynccontextmanager
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from app.config import get_settings
 from app.routers import auth, auth_email, profiles, experiments, chat, users
-from app.services.redis_service import close_redis
+from redis.exceptions import RedisError
+from redis.utils import HIREDIS_AVAILABLE
+from app.services.http_service import close_http_client
+from app.services.redis_service import close_redis, rebuild_user_indexes
+from app.utils.responses import ORJSONResponse
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    if not HIREDIS_AVAILABLE:
+        logger.warning("hiredis is not installed; Redis replies use the pure-Python parser")
+    try:
+        indexed = await rebuild_user_indexes()
+        if indexed is not None:
+            logger.info("Indexed %d users for login lookups", indexed)
+    except RedisError as exc:
+        logger.warning("Could not rebuild user lookup indexes: %s", exc)
     yield
     # Shutdown
     await close_redis()
+    await close_http_client()
 
 
 app = FastAPI(
     title="Other Us API",
     description="Backend API for the Other Us social networking platform.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -41,6 +60,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ── Compression ───────────────────────────────────────────────────────────────
+# Member, profile and message lists compress well; tiny bodies aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # ── Routers ───────────────────────────────────────────────────────────────────
 app.include_router(auth.router)
 app.include_router(auth_email.router)
@@ -50,6 +73,10 @@ app.include_router(chat.router)
 app.include_router(users.router)
 
 
+# The health payload never changes, so encode it once
+_HEALTH_BODY = orjson.dumps({"status": "ok", "app": settings.app_name})
+
+
 @app.get("/health")
 async def health_check():
-    return {"status": "ok", "app": settings.app_name}
+    return Response(_HEALTH_BODY, media_type="application/json")
@@ -2,7 +2,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.utils.jwt_utils import decode_access_token
-from app.services.redis_service import json_get
+from app.services.redis_service import get_cached_user
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
@@ -17,7 +17,7 @@ async def get_current_user(
     user_id: str = payload.get("sub")
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-    user = await json_get(f"user:{user_id}")
+    user = await get_cached_user(user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
@@ -32,4 +32,4 @@ async def get_optional_user(
     user_id: str = payload.get("sub")
     if not user_id:
         return None
-    return await json_get(f"user:{user_id}")
+    return await get_cached_user(user_id)
@@ -1,33 +1,45 @@
 """OAuth authentication router — Google and GitHub."""
-import uuid
-import httpx
-from datetime import datetime, timezone
+import asyncio
+import secrets
+from urllib.parse import urlencode
+import orjson
 from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import RedirectResponse, JSONResponse
-from authlib.integrations.httpx_client import AsyncOAuth2Client
+from authlib.common.security import generate_token
 from app.config import get_settings
+from app.services.http_service import get_http_client
 from app.models.schemas import TokenResponse, UserFull
-from app.services.redis_service import json_set, json_get, keys_matching
+from app.services.redis_service import (
+    json_set_fields, get_cached_user, find_user_by_index, save_user, provider_index_key
+)
 from app.utils.jwt_utils import create_access_token
+from app.utils.time_utils import utc_now_iso
 router = APIRouter(prefix="/auth", tags=["auth"])
 settings = get_settings()
+# Authorize URLs only vary by the per-request state, so build the rest once
+_GOOGLE_AUTHORIZE_URL = "https://accounts.google.com/o/oauth2/v2/auth?" + urlencode({
+    "response_type": "code",
+    "client_id": settings.google_client_id,
+    "redirect_uri": settings.google_redirect_uri,
+    "scope": "openid email profile",
+    "access_type": "offline",
+})
+_GITHUB_AUTHORIZE_URL = "https://github.com/login/oauth/authorize?" + urlencode({
+    "client_id": settings.github_client_id,
+    "redirect_uri": settings.github_redirect_uri,
+    "scope": "read:user user:email",
+})
 # ── Helpers ───────────────────────────────────────────────────────────────────
 async def _find_user_by_provider(provider: str, provider_id: str) -> dict | None:
-    keys = await keys_matching("user:*")
-    for key in keys:
-        user = await json_get(key)
-        print('user: ',user," key: ",key,"provider: ",provider,"provider_id: ",provider_id)
-        if user and user.get("provider") == provider and user.get("provider_id") == str(provider_id):
-            return user
-    return None
+    return await find_user_by_index(provider_index_key(provider, str(provider_id)))
 async def _upsert_user(provider: str, provider_id: str, email: str, name: str, avatar_url: str | None) -> dict:
     existing = await _find_user_by_provider(provider, provider_id)
     if existing:
         existing["name"] = name
         existing["avatar_url"] = avatar_url
-        await json_set(f"user:{existing['id']}", ".", existing)
+        await json_set_fields(f"user:{existing['id']}", {"name": name, "avatar_url": avatar_url})
         return existing
-    user_id = str(uuid.uuid4())
+    user_id = secrets.token_hex(16)
     ntfy_topic = f"{settings.ntfy_topic_prefix}-{user_id[:8]}"
     user = {
         "id": user_id,
@@ -36,12 +48,12 @@ async def _upsert_user(provider: str, provider_id: str, email: str, name: str, a
         "avatar_url": avatar_url,
         "provider": provider,
         "provider_id": str(provider_id),
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": utc_now_iso(),
         "ntfy_topic": ntfy_topic,
         "is_admin": False,
         "profile": None,
     }
-    await json_set(f"user:{user_id}", ".", user)
+    await save_user(user)
     return user
 def _make_token_response(user: dict) -> dict:
     token = create_access_token({"sub": user["id"]})
@@ -54,37 +66,41 @@ def _make_token_response(user: dict) -> dict:
 @router.get("/google/login")
 async def google_login():
     """Redirect the user to Google's OAuth consent screen."""
-    client = AsyncOAuth2Client(
-        client_id=settings.google_client_id,
-        client_secret=settings.google_client_secret,
-        redirect_uri=settings.google_redirect_uri,
-        scope="openid email profile",
-    )
-    uri, _ = client.create_authorization_url(
-        "https://accounts.google.com/o/oauth2/v2/auth",
-        access_type="offline",
-    )
-    return RedirectResponse(uri)
+    return RedirectResponse(f"{_GOOGLE_AUTHORIZE_URL}&state={generate_token(30)}")
 @router.get("/google/callback")
 async def google_callback(code: str, state: str | None = None):
-    """Handle Google OAuth callback, exchange code for user info."""
-    async with AsyncOAuth2Client(
-        client_id=settings.google_client_id,
-        client_secret=settings.google_client_secret,
-        redirect_uri=settings.google_redirect_uri,
-    ) as client: # type: ignore
-        try:
-            token = await client.fetch_token(
-                "https://oauth2.googleapis.com/token",
-                code=code,
-            )
-        except Exception as exc:
-            raise HTTPException(status_code=400, detail=f"Token exchange failed: {exc}")
+    """Handle Google OAuth callback, exchange code for user info.
 
-        resp = await client.get("https://www.googleapis.com/oauth2/v3/userinfo")
-        info = resp.json()
-    
-    print("code:",code,"state:",state,"token:",token,"info:",info)
+    Both calls go through the shared HTTP client rather than a per-login Authlib
+    session, so logins reuse pooled connections to Google.
+    """
+    client = get_http_client()
+    try:
+        token_resp = await client.post(
+            "https://oauth2.googleapis.com/token",
+            data={
+                "grant_type": "authorization_code",
+                "code": code,
+                "client_id": settings.google_client_id,
+                "client_secret": settings.google_client_secret,
+                "redirect_uri": settings.google_redirect_uri,
+            },
+            headers={"Accept": "application/json"},
+        )
+        token = orjson.loads(token_resp.content)
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=f"Token exchange failed: {exc}")
+    if not isinstance(token, dict):
+        token = {}
+    access_token = token.get("access_token")
+    if token_resp.status_code != 200 or not access_token:
+        error = token.get("error_description") or token.get("error") or token_resp.status_code
+        raise HTTPException(status_code=400, detail=f"Token exchange failed: {error}")
+    resp = await client.get(
+        "https://www.googleapis.com/oauth2/v3/userinfo",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    info = orjson.loads(resp.content)
     user = await _upsert_user(
         provider="google",
         provider_id=info["sub"],
@@ -100,42 +116,52 @@ async def google_callback(code: str, state: str | None = None):
 @router.get("/github/login")
 async def github_login():
     """Redirect the user to GitHub's OAuth consent screen."""
-    params = (
-        f"client_id={settings.github_client_id}"
-        f"&redirect_uri={settings.github_redirect_uri}"
-        f"&scope=read:user%20user:email"
-    )
-    print("Redirecting to GitHub with params:", f"https://github.com/login/oauth/authorize?{params}")
-    return RedirectResponse(f"https://github.com/login/oauth/authorize?{params}")
+    return RedirectResponse(_GITHUB_AUTHORIZE_URL)
+def _primary_github_email(emails_resp) -> str | None:
+    """Primary address from a /user/emails reply, or None if the call failed or is malformed."""
+    if isinstance(emails_resp, BaseException) or emails_resp.status_code != 200:
+        return None
+    try:
+        emails = orjson.loads(emails_resp.content)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(emails, list):
+        return None
+    primary = next((e for e in emails if isinstance(e, dict) and e.get("primary")), None)
+    return primary.get("email") if primary else None
 @router.get("/github/callback")
 async def github_callback(code: str):
     """Handle GitHub OAuth callback."""
-    async with httpx.AsyncClient() as client:
-        token_resp = await client.post(
-            "https://github.com/login/oauth/access_token",
-            data={
-                "client_id": settings.github_client_id,
-                "client_secret": settings.github_client_secret,
-                "code": code,
-            },
-            headers={"Accept": "application/json"},
-        )
-        print("GitHub token response:", token_resp.text)
-        token_data = token_resp.json()
-        access_token = token_data.get("access_token")
-        if not access_token:
-            raise HTTPException(status_code=400, detail="GitHub token exchange failed")
-        headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
-        user_resp = await client.get("https://api.github.com/user", headers=headers)
-        gh_user = user_resp.json()
-        # Fetch primary email if not public
-        email = gh_user.get("email")
-        if not email:
-            emails_resp = await client.get("https://api.github.com/user/emails", headers=headers)
-            emails = emails_resp.json()
-            primary = next((e for e in emails if e.get("primary")), None)
-            email = primary["email"] if primary else f"{gh_user['login']}@github.local"
-        print("GitHub user info:", gh_user, "email:", email)
+    client = get_http_client()
+    token_resp = await client.post(
+        "https://github.com/login/oauth/access_token",
+        data={
+            "client_id": settings.github_client_id,
+            "client_secret": settings.github_client_secret,
+            "code": code,
+        },
+        headers={"Accept": "application/json"},
+    )
+    token_data = orjson.loads(token_resp.content)
+    access_token = token_data.get("access_token")
+    if not access_token:
+        raise HTTPException(status_code=400, detail="GitHub token exchange failed")
+    headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
+    # Profile and email list only share the token, so fetch them concurrently.
+    # The email list is optional: a failure there must not fail the login.
+    user_resp, emails_resp = await asyncio.gather(
+        client.get("https://api.github.com/user", headers=headers),
+        client.get("https://api.github.com/user/emails", headers=headers),
+        return_exceptions=True,
+    )
+    if isinstance(user_resp, BaseException):
+        raise user_resp
+    gh_user = orjson.loads(user_resp.content)
+    # Fall back to the primary email if the public one is hidden
+    email = gh_user.get("email") or _primary_github_email(emails_resp)
+    if not email:
+        email = f"{gh_user['login']}@github.local"
+    print("GitHub user info:", gh_user, "email:", email)
     user = await _upsert_user(
         provider="github",
         provider_id=str(gh_user["id"]),
@@ -160,7 +186,7 @@ async def get_me(request: Request):
     payload = decode_access_token(token)
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid token")
-    user = await json_get(f"user:{payload['sub']}")
+    user = await get_cached_user(payload["sub"])
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
\ No newline at end of file
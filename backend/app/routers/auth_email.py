@@ -1,12 +1,14 @@
 """Email/password authentication endpoints."""
-import uuid
-from datetime import datetime, timezone
+import secrets
 from email_validator import validate_email, EmailNotValidError # type: ignore
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, EmailStr
-from app.services.redis_service import json_get, json_set, json_mget, keys_matching
+from app.services.redis_service import (
+    json_get, json_set_fields, find_user_by_index, claim_value, delete_key, save_user, email_index_key
+)
 from app.utils.jwt_utils import create_access_token
-from app.utils.password_utils import hash_password, verify_password
+from app.utils.password_utils import hash_password_async, verify_password_async, needs_rehash
+from app.utils.time_utils import utc_now_iso
 from app.config import get_settings
 router = APIRouter(prefix="/auth", tags=["auth"])
 print(router.prefix)
@@ -36,38 +38,41 @@ async def register(req: RegisterRequest):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid email: {str(e)}",
         )
-    # Check if user already exists
-
-    existing = await json_get(f"user:email:{req.email.lower()}")
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already registered.",
-        )
     # Validate password strength (minimum 8 characters)
     if len(req.password) < 8:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Password must be at least 8 characters long.",
         )
-    # Create new user
-    user_id = str(uuid.uuid4())
+    # Create new user (the KDF runs in a worker thread so the event loop stays free)
+    password_hash = await hash_password_async(req.password)
+    user_id = secrets.token_hex(16)
     user = {
         "id": user_id,
         "email": req.email.lower(),
         "name": req.name,
-        "password_hash": hash_password(req.password),
+        "password_hash": password_hash,
         "provider": "email",
         "provider_id": req.email.lower(),
         "avatar_url": None,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": utc_now_iso(),
         "ntfy_topic": f"other-us-{user_id[:8]}",
         "is_admin": False,
         "profile": None,
     }
+    # Claim the email with SET NX so two concurrent registrations can't both win
+    email_key = email_index_key(req.email)
+    if not await claim_value(email_key, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Email already registered.",
+        )
     # Store user in Redis
-    await json_set(f"user:{user_id}", ".", user)
-    # await json_set(f"user:email:{req.email.lower()}", ".", {"id": user_id})
+    try:
+        await save_user(user)
+    except BaseException:
+        await delete_key(email_key)
+        raise
     # Generate token
     token = create_access_token({"sub": user_id})
     # Remove sensitive fields before returning
@@ -78,22 +83,13 @@ async def register(req: RegisterRequest):
         user=user_response,
     )
 async def _find_user_by_email(email: str) -> dict | None:
-    """Scan all user:{id} documents and return the one matching the given email."""
-    # Get all keys matching user:{id} pattern (exactly one colon — excludes user:email:* etc.)
-    user_keys = [k for k in await keys_matching("user:*") if k.count(":") == 1]
-    if not user_keys:
-        return None
-    # Fetch all user documents in a single Redis round-trip
-    users = await json_mget(user_keys)
-    for user in users:
-        if user and user.get("email", "").lower() == email.lower():
-            return user
-    return None
+    """Resolve an email/password account through the email_to_id index."""
+    return await find_user_by_index(email_index_key(email))
 @router.post("/email/login", response_model=AuthResponse)
 async def login(req: LoginRequest):
     """Login with email and password."""
     print(f"Login attempt for email: {req.email}")
-    # Find user by scanning user:{id} documents for a matching email field
+    # Find user through the email -> id lookup key
     user = await _find_user_by_email(req.email.lower())
     if not user:
         raise HTTPException(
@@ -101,11 +97,15 @@ async def login(req: LoginRequest):
             detail="Invalid email or password.",
         )
     # Verify password
-    if not verify_password(req.password, user.get("password_hash", "")):
+    if not await verify_password_async(req.password, user.get("password_hash", "")):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
         )
+    # Upgrade legacy bcrypt hashes to argon2id now that we have the plaintext
+    if needs_rehash(user["password_hash"]):
+        user["password_hash"] = await hash_password_async(req.password)
+        await json_set_fields(f"user:{user['id']}", {"password_hash": user["password_hash"]})
     user_id = user["id"]
     # Generate token
     token = create_access_token({"sub": user_id})
@@ -136,7 +136,7 @@ async def change_password(req: ChangePasswordRequest, user_id: str = None):
             detail="Password change only available for email-based accounts.",
         )
     # Verify old password
-    if not verify_password(req.old_password, user.get("password_hash", "")):
+    if not await verify_password_async(req.old_password, user.get("password_hash", "")):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect current password.",
@@ -148,6 +148,6 @@ async def change_password(req: ChangePasswordRequest, user_id: str = None):
             detail="New password must be at least 8 characters long.",
         )
     # Update password
-    user["password_hash"] = hash_password(req.new_password)
-    await json_set(f"user:{user_id}", ".", user)
+    password_hash = await hash_password_async(req.new_password)
+    await json_set_fields(f"user:{user_id}", {"password_hash": password_hash})
     return {"message": "Password changed successfully."}
\ No newline at end of file
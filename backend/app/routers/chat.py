@@ -1,18 +1,20 @@
 """Chat router — REST endpoints + WebSocket for real-time messaging."""
 import uuid
-import json
 import asyncio
-from datetime import datetime, timezone
+import orjson
 from typing import Dict, Set
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Query
+from fastapi.responses import Response
 from app.middleware.auth import get_current_user
 from app.models.schemas import CreateRoomRequest, SendMessageRequest
 from app.services.redis_service import (
-    json_set, json_get, keys_matching, json_del, lpush, lrange, smembers, sadd, srem
+    json_set, json_set_fields, json_get, json_mget, get_cached_user, keys_matching, lpush, lrange
 )
 from app.services.rabbitmq_service import publish_message
-from app.services.notification_service import notify_user_of_message
+from app.services.notification_service import notify_user_of_message, run_in_background
 from app.utils.jwt_utils import decode_access_token
+from app.utils.responses import ORJSONResponse
+from app.utils.time_utils import utc_now_iso
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
@@ -29,18 +31,20 @@ async def create_room(
 ):
     """Create a DM or group chat room."""
     # For DMs, check if a room already exists between the two users
+    dm_key = None
     if body.type == "dm" and len(body.member_ids) == 1:
-        other_id = body.member_ids[0]
-        members_sorted = sorted([current_user["id"], other_id])
-        dm_key = f"dm:{members_sorted[0]}:{members_sorted[1]}"
+        first, second = sorted((current_user["id"], body.member_ids[0]))
+        dm_key = f"dm:{first}:{second}"
         existing_room_id = await json_get(dm_key)
         if existing_room_id:
             room = await json_get(f"room:{existing_room_id}")
             if room:
                 return room
     room_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat()
-    all_members = list(set([current_user["id"]] + body.member_ids))
+    now = utc_now_iso()
+    members = set(body.member_ids)
+    members.add(current_user["id"])
+    all_members = list(members)
     room = {
         "id": room_id,
         "type": body.type,
@@ -50,10 +54,7 @@ async def create_room(
         "last_message": None,
     }
     await json_set(f"room:{room_id}", ".", room)
-    if body.type == "dm" and len(body.member_ids) == 1:
-        other_id = body.member_ids[0]
-        members_sorted = sorted([current_user["id"], other_id])
-        dm_key = f"dm:{members_sorted[0]}:{members_sorted[1]}"
+    if dm_key:
         await json_set(dm_key, ".", room_id)
     return room
 @router.get("/rooms", response_model=list)
@@ -61,12 +62,11 @@ async def list_my_rooms(current_user: dict = Depends(get_current_user)):
     """List all chat rooms the current user is a member of."""
     keys = await keys_matching("room:*")
     rooms = []
-    for key in keys:
-        room = await json_get(key)
+    for room in await json_mget(keys):
         if room and current_user["id"] in room.get("members", []):
             rooms.append(room)
     rooms.sort(key=lambda r: (r.get("last_message") or {}).get("created_at", r["created_at"]), reverse=True)
-    return rooms
+    return ORJSONResponse(rooms)
 @router.get("/rooms/{room_id}", response_model=dict)
 async def get_room(room_id: str, current_user: dict = Depends(get_current_user)):
     room = await json_get(f"room:{room_id}")
@@ -90,9 +90,9 @@ async def get_messages(
     if current_user["id"] not in room.get("members", []):
         raise HTTPException(status_code=403, detail="Not a member")
     raw_messages = await lrange(f"messages:{room_id}", 0, limit - 1)
-    messages = [json.loads(m) for m in raw_messages]
-    messages.reverse()
-    return messages
+    # Messages are stored as JSON text, so splice them into an array as-is
+    # (oldest first) rather than decoding and re-encoding each one
+    return Response("[" + ",".join(reversed(raw_messages)) + "]", media_type="application/json")
 
 
 @router.post("/rooms/{room_id}/messages", response_model=dict, status_code=201)
@@ -127,7 +127,7 @@ async def websocket_chat(
         await websocket.close(code=4001)
         return
 
-    user = await json_get(f"user:{payload['sub']}")
+    user = await get_cached_user(payload["sub"])
     if not user:
         await websocket.close(code=4001)
         return
@@ -140,20 +140,18 @@ async def websocket_chat(
     await websocket.accept()
 
     # Register connection
-    if room_id not in _ws_connections:
-        _ws_connections[room_id] = set()
     conn_tuple = (user["id"], websocket)
-    _ws_connections[room_id].add(conn_tuple)
+    _ws_connections.setdefault(room_id, set()).add(conn_tuple)
 
     try:
         while True:
             data = await websocket.receive_text()
             try:
-                payload_data = json.loads(data)
+                payload_data = orjson.loads(data)
                 content = payload_data.get("content", "").strip()
                 if not content:
                     continue
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 content = data.strip()
 
             msg = _build_message(room_id, user, content)
@@ -162,11 +160,21 @@ async def websocket_chat(
     except WebSocketDisconnect:
         pass
     finally:
-        _ws_connections.get(room_id, set()).discard(conn_tuple)
+        _unregister_connection(room_id, conn_tuple)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+def _unregister_connection(room_id: str, conn: tuple) -> None:
+    """Remove a socket from the registry, dropping the room entry once it is empty."""
+    connections = _ws_connections.get(room_id)
+    if connections is None:
+        return
+    connections.discard(conn)
+    if not connections:
+        del _ws_connections[room_id]
+
+
 def _build_message(room_id: str, user: dict, content: str) -> dict:
     return {
         "id": str(uuid.uuid4()),
@@ -175,35 +183,40 @@ def _build_message(room_id: str, user: dict, content: str) -> dict:
         "sender_name": user["name"],
         "sender_avatar": user.get("avatar_url"),
         "content": content,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": utc_now_iso(),
     }
 
 
 async def _persist_and_broadcast(room: dict, msg: dict) -> None:
     room_id = room["id"]
+    # Encoded once for both the Redis history and the WebSocket broadcast
+    text = orjson.dumps(msg).decode()
     # Persist to Redis list
-    await lpush(f"messages:{room_id}", json.dumps(msg))
+    await lpush(f"messages:{room_id}", text)
     # Update last_message on room
     room["last_message"] = msg
-    await json_set(f"room:{room_id}", ".", room)
+    await json_set_fields(f"room:{room_id}", {"last_message": msg})
     # Publish to RabbitMQ
     try:
         await publish_message(room_id, msg)
     except Exception:
         pass  # RabbitMQ unavailable — degrade gracefully
 
-    # Broadcast to connected WebSocket clients in this room
-    active_user_ids = {uid for uid, _ in _ws_connections.get(room_id, set())}
-    for uid, ws in list(_ws_connections.get(room_id, set())):
-        try:
-            await ws.send_text(json.dumps(msg))
-        except Exception:
-            _ws_connections.get(room_id, set()).discard((uid, ws))
+    # Broadcast to connected WebSocket clients in this room, concurrently so
+    # one slow socket doesn't hold up the rest
+    connections = list(_ws_connections.get(room_id, set()))
+    active_user_ids = {uid for uid, _ in connections}
+    results = await asyncio.gather(
+        *(ws.send_text(text) for _, ws in connections), return_exceptions=True
+    )
+    for conn, result in zip(connections, results):
+        if isinstance(result, Exception):
+            _unregister_connection(room_id, conn)
 
     # Send push notifications to offline members
     for member_id in room.get("members", []):
         if member_id != msg["sender_id"] and member_id not in active_user_ids:
-            asyncio.create_task(
+            run_in_background(
                 notify_user_of_message(
                     recipient_user_id=member_id,
                     sender_name=msg["sender_name"],
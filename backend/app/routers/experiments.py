@@ -1,10 +1,11 @@
 """Experiments and results router."""
 import uuid
-from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
 from app.middleware.auth import get_current_user
 from app.models.schemas import ExperimentCreate, ExperimentUpdate, ExperimentPublic
-from app.services.redis_service import json_set, json_get, keys_matching, json_del
+from app.services.redis_service import json_set, json_get, json_mget, keys_matching, json_del
+from app.utils.responses import ORJSONResponse
+from app.utils.time_utils import utc_now_iso
 
 router = APIRouter(prefix="/experiments", tags=["experiments"])
 
@@ -22,15 +23,14 @@ async def list_experiments(
     """List all experiments, optionally filtered by status."""
     keys = await keys_matching("experiment:*")
     results = []
-    for key in keys:
-        exp = await json_get(key)
+    for exp in await json_mget(keys):
         if exp is None:
             continue
         if status_filter and exp.get("status") != status_filter:
             continue
         results.append(exp)
     results.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    return results
+    return ORJSONResponse(results)
 
 
 @router.get("/{experiment_id}", response_model=dict)
@@ -50,7 +50,7 @@ async def create_experiment(
     current_user: dict = Depends(get_current_user),
 ):
     _require_admin(current_user)
-    now = datetime.now(timezone.utc).isoformat()
+    now = utc_now_iso()
     exp_id = str(uuid.uuid4())
     exp = {
         "id": exp_id,
@@ -85,7 +85,7 @@ async def update_experiment(
         exp["status"] = body.status
     if body.tags is not None:
         exp["tags"] = body.tags
-    exp["updated_at"] = datetime.now(timezone.utc).isoformat()
+    exp["updated_at"] = utc_now_iso()
     await json_set(f"experiment:{experiment_id}", ".", exp)
     return exp
 
@@ -1,11 +1,35 @@
 """Profile management router."""
-from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, status
+import re
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from app.middleware.auth import get_current_user
 from app.models.schemas import ProfileUpdate, ProfilePublic
-from app.services.redis_service import json_set, json_get, keys_matching, json_del
+from app.services.redis_service import (
+    json_set, json_set_fields, json_get, json_mget, keys_matching, json_set_many, delete_user, get_values, set_value
+)
+from app.utils.responses import ORJSONResponse
+from app.utils.time_utils import utc_now_iso
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
+# Profiles without stored search text are loaded and checked this many at a time
+_UNINDEXED_BATCH_SIZE = 256
+# Control characters never appear in profile text, so they are dropped from queries
+_QUERY_JUNK_RE = re.compile(r"[\x00-\x1f\x7f]")
+_MAX_QUERY_LENGTH = 64
+_MIN_QUERY_LENGTH = 2
+# Recent search results keyed by (query, limit). Profile writes in this process
+# clear it; the TTL bounds staleness for writes made by other workers.
+_search_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
+
+
+def _search_text(profile: dict) -> str:
+    """Lowercased text that profile search matches against."""
+    return f"{profile.get('user_name', '')}\n{profile.get('data', {})}".lower()
+
+
+def _normalize_query(search: str) -> str:
+    """Strip control characters and surrounding whitespace, cap the length and lowercase."""
+    return _QUERY_JUNK_RE.sub("", search).strip()[:_MAX_QUERY_LENGTH].lower()
 
 
 @router.get("/me", response_model=dict)
@@ -20,8 +44,19 @@ async def update_my_profile(
     body: ProfileUpdate,
     current_user: dict = Depends(get_current_user),
 ):
-    """Create or update the current user's profile."""
-    now = datetime.now(timezone.utc).isoformat()
+    """Create or update the current user's profile.
+
+    Auto-save often resends identical data; that returns the stored profile untouched.
+    """
+    existing = await json_get(f"profile:{current_user['id']}")
+    if (
+        existing is not None
+        and existing.get("data") == body.data
+        and existing.get("user_name") == current_user["name"]
+        and existing.get("avatar_url") == current_user.get("avatar_url")
+    ):
+        return existing
+    now = utc_now_iso()
     profile = {
         "user_id": current_user["id"],
         "user_name": current_user["name"],
@@ -30,34 +65,55 @@ async def update_my_profile(
         "updated_at": now,
     }
     await json_set(f"profile:{current_user['id']}", ".", profile)
-    # Also update the user record to mark profile as set
-    user = await json_get(f"user:{current_user['id']}")
-    if user:
-        user["profile"] = True
-        await json_set(f"user:{current_user['id']}", ".", user)
+    # Precompute the search text once per write instead of once per search
+    await set_value(f"profile_search:{current_user['id']}", _search_text(profile))
+    _search_cache.clear()
+    # Also update the user record to mark profile as set. The cached user can
+    # outlive a deleted document, and a field SET on a missing key is rejected.
+    if not current_user.get("profile") and await json_get(f"user:{current_user['id']}") is not None:
+        await json_set_fields(f"user:{current_user['id']}", {"profile": True})
     return profile
 
 
 @router.get("/", response_model=list)
 async def list_profiles(
     search: str = "",
+    limit: int = Query(50, ge=1, le=500),
     current_user: dict = Depends(get_current_user),
 ):
-    """List all public profiles, optionally filtered by search term."""
+    """List all public profiles, optionally filtered by search term.
+
+    Search results are capped at ``limit`` profiles; the unfiltered listing is not.
+    Queries shorter than two characters after normalisation match nothing.
+    """
+    if not search:
+        keys = await keys_matching("profile:*")
+        return ORJSONResponse([p for p in await json_mget(keys) if p is not None])
+    query = _normalize_query(search)
+    if len(query) < _MIN_QUERY_LENGTH:
+        return ORJSONResponse([])
+    cached = _search_cache.get((query, limit))
+    if cached is not None:
+        return ORJSONResponse(cached)
     keys = await keys_matching("profile:*")
-    profiles = []
-    for key in keys:
-        p = await json_get(key)
-        if p is None:
-            continue
-        if search:
-            name_match = search.lower() in p.get("user_name", "").lower()
-            data_str = str(p.get("data", {})).lower()
-            data_match = search.lower() in data_str
-            if not (name_match or data_match):
-                continue
-        profiles.append(p)
-    return profiles
+    texts = await get_values([f"profile_search:{key.split(':', 1)[1]}" for key in keys])
+    matched, unindexed = [], []
+    for key, text in zip(keys, texts):
+        if text is None:
+            unindexed.append(key)  # saved before search text was stored
+        elif query in text:
+            matched.append(key)
+            if len(matched) >= limit:
+                break
+    profiles = [p for p in await json_mget(matched) if p is not None]
+    for start in range(0, len(unindexed), _UNINDEXED_BATCH_SIZE):
+        if len(profiles) >= limit:
+            break
+        batch = await json_mget(unindexed[start:start + _UNINDEXED_BATCH_SIZE])
+        profiles += [p for p in batch if p is not None and query in _search_text(p)]
+    profiles = profiles[:limit]
+    _search_cache[(query, limit)] = profiles
+    return ORJSONResponse(profiles)
 
 
 @router.get("/{user_id}", response_model=dict)
@@ -76,18 +132,20 @@ async def get_profile(
 async def delete_my_account(current_user: dict = Depends(get_current_user)):
     """Delete the current user's account and all associated data."""
     uid = current_user["id"]
-    # Delete profile
-    await json_del(f"profile:{uid}")
-    # Delete chat rooms membership (rooms where user is a member)
+    # Drop the user from every room they belong to: read all rooms in batched
+    # MGETs, then write the survivors back in one pipeline and delete the rest
     room_keys = await keys_matching("room:*")
-    for key in room_keys:
-        room = await json_get(key)
+    updated: dict[str, dict] = {}
+    emptied: list[str] = []
+    for key, room in zip(room_keys, await json_mget(room_keys)):
         if room and uid in room.get("members", []):
             room["members"] = [m for m in room["members"] if m != uid]
-            if not room["members"]:
-                await json_del(key)
+            if room["members"]:
+                updated[key] = room
             else:
-                await json_set(key, ".", room)
-    # Delete user record
-    await json_del(f"user:{uid}")
+                emptied.append(key)
+    await json_set_many(updated)
+    # Delete user record, its lookup keys, profile and emptied rooms in a single DEL
+    await delete_user(current_user, f"profile:{uid}", f"profile_search:{uid}", *emptied)
+    _search_cache.clear()
     return None
@@ -2,40 +2,31 @@
 from fastapi import APIRouter, Depends, HTTPException
 from app.middleware.auth import get_current_user
 from app.models.schemas import NotificationSubscribe
-from app.services.redis_service import json_set, json_get, keys_matching
+from app.services.redis_service import json_set_fields, json_get, json_get_fields, get_cached_user, keys_matching
+from app.utils.responses import ORJSONResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
+# Fields of a user document that other members may see
+_PUBLIC_KEYS = ("id", "name", "avatar_url", "created_at")
+
+
+def _public_user_view(user: dict) -> dict:
+    return {k: user.get(k) for k in _PUBLIC_KEYS}
 
 
 @router.get("/", response_model=list)
 async def list_users(current_user: dict = Depends(get_current_user)):
     """Return a list of all users (public fields only)."""
     keys = await keys_matching("user:*")
-    users = []
-    for key in keys:
-        u = await json_get(key)
-        print('user: ',u," key: ",key)
-        if u:
-            users.append({
-                "id": u["id"],
-                "name": u["name"],
-                "avatar_url": u.get("avatar_url"),
-                "created_at": u.get("created_at"),
-            })
-    return users
+    return ORJSONResponse([u for u in await json_get_fields(keys, _PUBLIC_KEYS) if u])
 
 
 @router.get("/{user_id}", response_model=dict)
 async def get_user(user_id: str, current_user: dict = Depends(get_current_user)):
-    user = await json_get(f"user:{user_id}")
+    user = await get_cached_user(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return {
-        "id": user["id"],
-        "name": user["name"],
-        "avatar_url": user.get("avatar_url"),
-        "created_at": user.get("created_at"),
-    }
+    return _public_user_view(user)
 
 
 @router.put("/me/ntfy", response_model=dict)
@@ -44,11 +35,14 @@ async def update_ntfy_topic(
     current_user: dict = Depends(get_current_user),
 ):
     """Update the user's ntfy.sh topic for push notifications."""
-    user = await json_get(f"user:{current_user['id']}")
-    if not user:
+    key = f"user:{current_user['id']}"
+    # Re-saving the same topic skips the write and keeps the user cache warm.
+    # Compare against Redis, not the cached user, which may trail other workers.
+    stored = await json_get(key)
+    if stored is None:
         raise HTTPException(status_code=404, detail="User not found")
-    user["ntfy_topic"] = body.ntfy_topic
-    await json_set(f"user:{current_user['id']}", ".", user)
+    if stored.get("ntfy_topic") != body.ntfy_topic:
+        await json_set_fields(key, {"ntfy_topic": body.ntfy_topic})
     return {"ntfy_topic": body.ntfy_topic}
 
 
@@ -59,5 +53,5 @@ async def toggle_admin(current_user: dict = Depends(get_current_user)):
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     user["is_admin"] = not user.get("is_admin", False)
-    await json_set(f"user:{current_user['id']}", ".", user)
+    await json_set_fields(f"user:{current_user['id']}", {"is_admin": user["is_admin"]})
     return {"is_admin": user["is_admin"]}
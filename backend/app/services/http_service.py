@@ -0,0 +1,24 @@
+"""Shared httpx client for outbound HTTP calls (GitHub OAuth, ntfy.sh)."""
+from typing import Optional
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client so connections and TLS sessions are reused."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client on shutdown; the next call to get_http_client opens a new one."""
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
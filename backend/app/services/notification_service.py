@@ -1,9 +1,31 @@
 """Push notification service using ntfy.sh."""
-import httpx
+import asyncio
+import logging
+from typing import Any, Coroutine
 from app.config import get_settings
-from app.services.redis_service import json_get
+from app.services.http_service import get_http_client
+from app.services.redis_service import get_cached_user
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+# Caps concurrent ntfy requests so a message to a big room can't exhaust the HTTP pool
+_send_slots = asyncio.Semaphore(16)
+# The event loop only keeps weak references to tasks; hold them until they finish
+_background_tasks: set[asyncio.Task] = set()
+
+
+def run_in_background(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Schedule a notification coroutine without awaiting it, logging any failure."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+    return task
+
+
+def _on_background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background notification failed", exc_info=task.exception())
 
 
 async def send_push_notification(
@@ -24,9 +46,9 @@ async def send_push_notification(
         headers["Click"] = click_url
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, content=message, headers=headers, timeout=5.0)
-            return resp.status_code == 200
+        async with _send_slots:
+            resp = await get_http_client().post(url, content=message, headers=headers, timeout=5.0)
+        return resp.status_code == 200
     except Exception:
         return False
 
@@ -38,7 +60,7 @@ async def notify_user_of_message(
     message_preview: str,
 ) -> bool:
     """Notify a user about a new chat message if they have a ntfy topic set."""
-    user = await json_get(f"user:{recipient_user_id}")
+    user = await get_cached_user(recipient_user_id)
     if not user:
         return False
     ntfy_topic = user.get("ntfy_topic")
@@ -1,6 +1,6 @@
 """RabbitMQ service for chat message orchestration via aio-pika."""
-import json
 import asyncio
+import orjson
 from typing import Callable, Coroutine, Any, Optional
 import aio_pika
 from aio_pika import ExchangeType
@@ -8,25 +8,30 @@ from app.config import get_settings
 
 _connection: Optional[aio_pika.abc.AbstractRobustConnection] = None
 _channel: Optional[aio_pika.abc.AbstractChannel] = None
+# Declared once per channel; re-declaring on every publish costs a broker round-trip
+_exchange: Optional[aio_pika.abc.AbstractExchange] = None
 EXCHANGE_NAME = "other_us_chat"
 
 
 async def get_channel() -> aio_pika.abc.AbstractChannel:
-    global _connection, _channel
+    global _connection, _channel, _exchange
     settings = get_settings()
     if _connection is None or _connection.is_closed:
         _connection = await aio_pika.connect_robust(settings.rabbitmq_url)
     if _channel is None or _channel.is_closed:
         _channel = await _connection.channel()
+        _exchange = None
     return _channel
 
 
 async def get_exchange() -> aio_pika.abc.AbstractExchange:
+    global _exchange
     channel = await get_channel()
-    exchange = await channel.declare_exchange(
-        EXCHANGE_NAME, ExchangeType.TOPIC, durable=True
-    )
-    return exchange
+    if _exchange is None:
+        _exchange = await channel.declare_exchange(
+            EXCHANGE_NAME, ExchangeType.TOPIC, durable=True
+        )
+    return _exchange
 
 
 async def publish_message(room_id: str, message: dict) -> None:
@@ -35,7 +40,7 @@ async def publish_message(room_id: str, message: dict) -> None:
     routing_key = f"room.{room_id}"
     await exchange.publish(
         aio_pika.Message(
-            body=json.dumps(message).encode(),
+            body=orjson.dumps(message),
             content_type="application/json",
             delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
         ),
@@ -60,7 +65,7 @@ async def subscribe_to_room(
 
     async def on_message(msg: aio_pika.abc.AbstractIncomingMessage):
         async with msg.process():
-            data = json.loads(msg.body)
+            data = orjson.loads(msg.body)
             await callback(data)
 
     await queue.consume(on_message, consumer_tag=consumer_tag or None)
@@ -68,10 +73,11 @@ async def subscribe_to_room(
 
 
 async def close_connection():
-    global _connection, _channel
+    global _connection, _channel, _exchange
     if _channel and not _channel.is_closed:
         await _channel.close()
     if _connection and not _connection.is_closed:
         await _connection.close()
     _connection = None
     _channel = None
+    _exchange = None
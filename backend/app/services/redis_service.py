@@ -1,22 +1,40 @@
 """Redis / RedisJSON connection and helpers."""
-import json
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
+import orjson
+from cachetools import TTLCache
 import redis.asyncio as aioredis
 from app.config import get_settings
+from app.utils.time_utils import utc_now_iso
 
 _redis: Optional[aioredis.Redis] = None
+# Upper bound on keys per JSON.MGET so huge keyspaces don't build one giant reply
+MGET_BATCH_SIZE = 1000
+# Hot user documents keyed by "user:<id>". Writes through json_set/json_del evict
+# the entry; the TTL bounds staleness for writes made by other workers.
+_user_cache: TTLCache = TTLCache(maxsize=20_000, ttl=10)
+
+
+def _connection_pool(settings) -> aioredis.BlockingConnectionPool:
+    """Capped pool where callers wait for a free connection instead of failing.
+
+    A plain ConnectionPool with max_connections raises "Too many connections" as
+    soon as the cap is reached; the blocking pool queues the caller for up to
+    redis_pool_timeout seconds.
+    """
+    return aioredis.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        username=settings.redis_username,
+        password=settings.redis_password,
+        decode_responses=True,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+    )
 
 
 async def get_redis() -> aioredis.Redis:
     global _redis
     if _redis is None:
-        settings = get_settings()
-        _redis = aioredis.from_url(
-            settings.redis_url,
-            username=settings.redis_username,
-            password=settings.redis_password,
-            decode_responses=True,
-        )
+        _redis = aioredis.Redis(connection_pool=_connection_pool(get_settings()))
     return _redis
 async def close_redis():
     global _redis
@@ -26,7 +44,26 @@ async def close_redis():
 # ── RedisJSON helpers ─────────────────────────────────────────────────────────
 async def json_set(key: str, path: str, value: Any) -> None:
     r = await get_redis()
-    await r.execute_command("JSON.SET", key, path, json.dumps(value))
+    await r.execute_command("JSON.SET", key, path, orjson.dumps(value))
+    _user_cache.pop(key, None)
+async def json_set_fields(key: str, fields: dict[str, Any]) -> None:
+    """Update top-level fields of an existing document without rewriting the rest."""
+    r = await get_redis()
+    pipe = r.pipeline(transaction=False)
+    for field, value in fields.items():
+        pipe.execute_command("JSON.SET", key, f".{field}", orjson.dumps(value))
+    await pipe.execute()
+    _user_cache.pop(key, None)
+async def json_set_many(docs: dict[str, Any]) -> None:
+    """JSON.SET several whole documents in one pipelined round-trip."""
+    if not docs:
+        return
+    r = await get_redis()
+    pipe = r.pipeline(transaction=False)
+    for key, value in docs.items():
+        pipe.execute_command("JSON.SET", key, ".", orjson.dumps(value))
+        _user_cache.pop(key, None)
+    await pipe.execute()
 async def json_get(key: str, path: str = ".") -> Optional[Any]:
     r = await get_redis()
     raw = await r.execute_command("JSON.GET", key, path)
@@ -36,28 +73,83 @@ async def json_get(key: str, path: str = ".") -> Optional[Any]:
     if isinstance(raw, dict):
         return raw
     # Otherwise, parse the JSON string
-    return json.loads(raw)
+    return orjson.loads(raw)
 async def json_del(key: str, path: str = ".") -> int:
     r = await get_redis()
+    _user_cache.pop(key, None)
     return await r.execute_command("JSON.DEL", key, path) # type: ignore
 async def json_mget(keys: list[str], path: str = ".") -> list[Optional[Any]]:
+    """Fetch many JSON documents, one JSON.MGET per MGET_BATCH_SIZE keys."""
     if not keys:
         return []
     r = await get_redis()
-    raws = await r.execute_command("JSON.MGET", *keys, path)
-    return [json.loads(r) if r else None for r in raws] # pyright: ignore[reportOptionalIterable]
+    results: list[Optional[Any]] = []
+    for start in range(0, len(keys), MGET_BATCH_SIZE):
+        batch = keys[start:start + MGET_BATCH_SIZE]
+        raws = await r.execute_command("JSON.MGET", *batch, path)
+        results.extend(orjson.loads(raw) if raw else None for raw in raws) # pyright: ignore[reportOptionalIterable]
+    return results
+async def json_get_fields(keys: list[str], fields: Sequence[str]) -> list[Optional[dict]]:
+    """Fetch only the named top-level fields of many documents.
+
+    Each key gets one JSONPath JSON.GET, sent in pipelines of MGET_BATCH_SIZE,
+    so fields outside ``fields`` never leave Redis. Missing fields come back as None.
+    """
+    paths = [f"$.{field}" for field in fields]
+    if not paths:
+        raise ValueError("json_get_fields needs at least one field")
+    r = await get_redis()
+    results: list[Optional[dict]] = []
+    for start in range(0, len(keys), MGET_BATCH_SIZE):
+        pipe = r.pipeline(transaction=False)
+        for key in keys[start:start + MGET_BATCH_SIZE]:
+            pipe.execute_command("JSON.GET", key, *paths)
+        for raw in await pipe.execute():
+            if raw is None:
+                results.append(None)
+                continue
+            values = orjson.loads(raw)
+            if len(paths) == 1:
+                # A single path replies with the bare match array, not a path map
+                values = {paths[0]: values}
+            results.append({f: (values.get(p) or [None])[0] for f, p in zip(fields, paths)})
+    return results
+async def get_cached_user(user_id: str) -> Optional[dict]:
+    """Return a user document, served from the in-process cache when fresh."""
+    key = f"user:{user_id}"
+    user = _user_cache.get(key)
+    if user is None:
+        user = await json_get(key)
+        if user is None:
+            return None
+        _user_cache[key] = user
+    return dict(user)
 async def keys_matching(pattern: str) -> list[str]:
     r = await get_redis()
     return await r.keys(pattern)
+async def set_value(key: str, value: str) -> None:
+    r = await get_redis()
+    await r.set(key, value)
+async def claim_value(key: str, value: str) -> bool:
+    """SET key only if it does not exist yet; True when this call created it."""
+    r = await get_redis()
+    return bool(await r.set(key, value, nx=True))
 async def set_with_expiry(key: str, value: str, seconds: int) -> None:
     r = await get_redis()
     await r.setex(key, seconds, value)
 async def get_value(key: str) -> Optional[str]:
     r = await get_redis()
     return await r.get(key)
-async def delete_key(key: str) -> int:
+async def get_values(keys: list[str]) -> list[Optional[str]]:
+    """MGET plain string keys, MGET_BATCH_SIZE keys per round-trip."""
+    r = await get_redis()
+    results: list[Optional[str]] = []
+    for start in range(0, len(keys), MGET_BATCH_SIZE):
+        results.extend(await r.mget(keys[start:start + MGET_BATCH_SIZE]))
+    return results
+async def delete_key(*keys: str) -> int:
     r = await get_redis()
-    return await r.delete(key)
+    return await r.delete(*keys)
 async def sadd(key: str, *members: str) -> int:
     r = await get_redis()
     return await r.sadd(key, *members) # type: ignore
@@ -74,4 +166,65 @@ async def lpush(key: str, *values: str) -> int:
 
 async def lrange(key: str, start: int, end: int) -> list[str]:
     r = await get_redis()
-    return await r.lrange(key, start, end) # type: ignore
\ No newline at end of file
+    return await r.lrange(key, start, end) # type: ignore
+
+
+# ── User lookup indexes ───────────────────────────────────────────────────────
+# Plain string keys mapping a login identity to its user id, so login and OAuth
+# upserts resolve a user with one GET instead of scanning every user:* document.
+def email_index_key(email: str) -> str:
+    return f"email_to_id:{email.lower()}"
+def provider_index_key(provider: str, provider_id: str) -> str:
+    return f"provider_to_id:{provider}:{provider_id}"
+def user_index_keys(user: dict) -> list[str]:
+    """Index keys pointing at this user. Only password accounts are indexed by email."""
+    if user.get("provider") == "email":
+        return [email_index_key(user["email"])]
+    return [provider_index_key(user["provider"], str(user["provider_id"]))]
+async def save_user(user: dict) -> None:
+    """JSON.SET a user document and SET its lookup keys in one round-trip."""
+    r = await get_redis()
+    key = f"user:{user['id']}"
+    pipe = r.pipeline(transaction=False)
+    pipe.execute_command("JSON.SET", key, ".", orjson.dumps(user))
+    for index_key in user_index_keys(user):
+        pipe.set(index_key, user["id"])
+    await pipe.execute()
+    _user_cache.pop(key, None)
+async def delete_user(user: dict, *related_keys: str) -> int:
+    """Delete a user document, its lookup keys and any related keys with one DEL."""
+    key = f"user:{user['id']}"
+    _user_cache.pop(key, None)
+    return await delete_key(key, *user_index_keys(user), *related_keys)
+async def find_user_by_index(index_key: str) -> Optional[dict]:
+    user_id = await get_value(index_key)
+    if not user_id:
+        return None
+    return await json_get(f"user:{user_id}")
+# Set once the backfill below has run, so later boots skip the full user scan
+USER_INDEX_MIGRATION_KEY = "migrations:user_indexes"
+async def rebuild_user_indexes() -> Optional[int]:
+    """Backfill lookup keys for users stored before the indexes existed.
+
+    A one-off migration: the first worker to claim USER_INDEX_MIGRATION_KEY runs
+    it and every other boot returns None. Keys are written with SET NX so an
+    index entry a concurrent register or login has just written is never replaced.
+    """
+    if not await claim_value(USER_INDEX_MIGRATION_KEY, utc_now_iso()):
+        return None
+    try:
+        keys = [k for k in await keys_matching("user:*") if k.count(":") == 1]
+        r = await get_redis()
+        pipe = r.pipeline(transaction=False)
+        count = 0
+        for user in await json_mget(keys):
+            if user and user.get("provider") and user.get("provider_id"):
+                for index_key in user_index_keys(user):
+                    pipe.set(index_key, user["id"], nx=True)
+                count += 1
+        await pipe.execute()
+    except BaseException:
+        # Let the next boot retry a backfill that didn't finish
+        await delete_key(USER_INDEX_MIGRATION_KEY)
+        raise
+    return count
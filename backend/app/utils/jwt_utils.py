@@ -1,8 +1,17 @@
 """JWT creation and verification utilities."""
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from app.config import get_settings
+
+# Recently verified tokens: blake2b(token) -> decoded payload. The short TTL
+# bounds how long a token stays accepted without re-checking its signature.
+_verified_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+_verified_tokens_lock = threading.Lock()
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     settings = get_settings()
     to_encode = data.copy()
@@ -12,9 +21,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
 def decode_access_token(token: str) -> Optional[dict]:
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _verified_tokens_lock:
+        payload = _verified_tokens.get(digest)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
     settings = get_settings()
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+    with _verified_tokens_lock:
+        _verified_tokens[digest] = payload
+    return payload
@@ -1,20 +1,49 @@
 """Password hashing and verification utilities."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# argon2id with the OWASP baseline parameters (19 MiB, 2 iterations, 1 lane)
+_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+# Hashes created before the switch to argon2id
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+# Dedicated workers for hashing so a login burst can't exhaust the default
+# executor, and concurrent argon2 memory stays bounded at 4 x 19 MiB
+_kdf_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kdf")
 
 def hash_password(password: str) -> str:
-    """Hash a plaintext password using bcrypt."""
-    # bcrypt requires bytes and has a 72 byte limit
-    password_bytes = password.encode('utf-8')
-    # Hash the password with auto-generated salt
-    hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
-    # Return as string for storage
-    return hashed.decode('utf-8')
+    """Hash a plaintext password using argon2id."""
+    return _hasher.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plaintext password against its hash."""
+    """Verify a plaintext password against an argon2id or legacy bcrypt hash."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        try:
+            return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+        except ValueError:
+            return False
+    try:
+        return _hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Return True if the hash is bcrypt or uses outdated argon2 parameters."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
     try:
-        password_bytes = plain_password.encode('utf-8')
-        hashed_bytes = hashed_password.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
-    except Exception:
+        return _hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
         return False
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the KDF thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_kdf_pool, hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the KDF thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _kdf_pool, verify_password, plain_password, hashed_password
+    )
@@ -0,0 +1,15 @@
+"""Response classes."""
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder.
+
+    List endpoints return this directly, which skips FastAPI's response_model
+    validation pass; the response_model still documents the route.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -0,0 +1,10 @@
+"""Timestamp helpers."""
+import time
+from datetime import datetime, timezone
+
+_UTC = timezone.utc
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.fromtimestamp(time.time(), _UTC).isoformat()
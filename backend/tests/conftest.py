@@ -21,12 +21,30 @@ class MockRedis:
         cmd = args[0].upper()
         if cmd == "JSON.SET":
             key, path, value = args[1], args[2], args[3]
-            self._store[key] = json.loads(value)
+            field = path.lstrip("$.")
+            if not field:
+                self._store[key] = json.loads(value)
+            elif key in self._store:
+                self._store[key][field] = json.loads(value)
+            else:
+                raise Exception("ERR new objects must be created at the root")
             return "OK"
         elif cmd == "JSON.GET":
             key = args[1]
             val = self._store.get(key)
-            return json.dumps(val) if val is not None else None
+            if val is None:
+                return None
+            paths = args[2:]
+            if not any(p.startswith("$.") for p in paths):
+                return json.dumps(val)
+            # JSONPath replies: [value] (or [] when absent) per path; a single
+            # path gets the bare array, several get a {"$.field": [...]} map
+            matches = {
+                p: [val[p[2:]]] if p[2:] in val else [] for p in paths
+            }
+            if len(paths) == 1:
+                return json.dumps(matches[paths[0]])
+            return json.dumps(matches)
         elif cmd == "JSON.DEL":
             key = args[1]
             self._store.pop(key, None)
@@ -41,12 +59,21 @@ class MockRedis:
         import fnmatch
         return [k for k in self._store if fnmatch.fnmatch(k, pattern)]
 
+    async def set(self, key, value, nx=False):
+        if nx and key in self._kv:
+            return None
+        self._kv[key] = value
+        return True
+
     async def setex(self, key, seconds, value):
         self._kv[key] = value
 
     async def get(self, key):
         return self._kv.get(key)
 
+    async def mget(self, keys):
+        return [self._kv.get(k) for k in keys]
+
     async def delete(self, *keys):
         for k in keys:
             self._store.pop(k, None)
@@ -78,10 +105,32 @@ class MockRedis:
             return lst[start:]
         return lst[start:end + 1]
 
+    def pipeline(self, transaction=True):
+        return MockPipeline(self)
+
     async def aclose(self):
         pass
 
 
+class MockPipeline:
+    """Queues MockRedis calls and runs them in order on execute()."""
+
+    def __init__(self, redis: MockRedis):
+        self._redis = redis
+        self._calls: list = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        results = [await getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+        self._calls.clear()
+        return results
+
+
 _mock_redis = MockRedis()
 
 
@@ -89,10 +138,13 @@ _mock_redis = MockRedis()
 def reset_and_inject_mock_redis():
     """Reset the in-memory Redis store and inject into redis_service before each test."""
     import app.services.redis_service as rs
+    import app.routers.profiles as profiles
     _mock_redis._store.clear()
     _mock_redis._sets.clear()
     _mock_redis._lists.clear()
     _mock_redis._kv.clear()
+    rs._user_cache.clear()
+    profiles._search_cache.clear()
     # Inject mock directly into the module-level variable
     rs._redis = _mock_redis
     yield
@@ -1,6 +1,7 @@
 """Tests for authentication endpoints."""
 import pytest
 from httpx import AsyncClient
+from unittest.mock import patch, AsyncMock, MagicMock
 
 
 @pytest.mark.asyncio
@@ -59,3 +60,134 @@ async def test_github_login_redirects(client: AsyncClient):
     response = await client.get("/auth/github/login", follow_redirects=False)
     assert response.status_code in (302, 307)
     assert "github.com" in response.headers.get("location", "")
+
+
+@pytest.mark.asyncio
+@patch("app.routers.auth_email.validate_email")
+async def test_register_and_login_with_email(_validate, client: AsyncClient):
+    """POST /auth/register then /auth/email/login should resolve the same user."""
+    response = await client.post(
+        "/auth/register",
+        json={"email": "New.User@example.com", "password": "s3cret-pass", "name": "New User"},
+    )
+    assert response.status_code == 201
+    user_id = response.json()["user"]["id"]
+    assert "password_hash" not in response.json()["user"]
+
+    response = await client.post(
+        "/auth/email/login",
+        json={"email": "new.user@example.com", "password": "s3cret-pass"},
+    )
+    assert response.status_code == 200
+    assert response.json()["user"]["id"] == user_id
+
+    response = await client.post(
+        "/auth/email/login",
+        json={"email": "new.user@example.com", "password": "wrong-pass"},
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+@patch("app.routers.auth_email.validate_email")
+async def test_register_duplicate_email(_validate, client: AsyncClient):
+    """Registering the same email twice should return 409."""
+    payload = {"email": "dup@example.com", "password": "s3cret-pass", "name": "Dup"}
+    assert (await client.post("/auth/register", json=payload)).status_code == 201
+    response = await client.post("/auth/register", json=payload)
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_login_upgrades_legacy_bcrypt_hash(client: AsyncClient):
+    """Logging in with a bcrypt-hashed password should rehash it with argon2id."""
+    import bcrypt
+    from app.services.redis_service import json_get, save_user
+
+    user = {
+        "id": "legacy-user",
+        "email": "legacy@example.com",
+        "name": "Legacy",
+        "password_hash": bcrypt.hashpw(b"old-password", bcrypt.gensalt(rounds=4)).decode(),
+        "provider": "email",
+        "provider_id": "legacy@example.com",
+    }
+    await save_user(user)
+
+    response = await client.post(
+        "/auth/email/login",
+        json={"email": "legacy@example.com", "password": "old-password"},
+    )
+    assert response.status_code == 200
+    stored = await json_get("user:legacy-user")
+    assert stored["password_hash"].startswith("$argon2id$")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_user_indexes_runs_once_without_overwriting():
+    """The index backfill runs once and never replaces an existing lookup key."""
+    from app.services.redis_service import json_set, rebuild_user_indexes, get_value, set_value
+
+    user = {"id": "u1", "email": "a@example.com", "provider": "email", "provider_id": "a@example.com"}
+    await json_set("user:u1", ".", user)
+    await set_value("email_to_id:b@example.com", "u-new")
+    await json_set("user:u2", ".", {**user, "id": "u2", "email": "b@example.com", "provider_id": "b@example.com"})
+
+    assert await rebuild_user_indexes() == 2
+    assert await get_value("email_to_id:a@example.com") == "u1"
+    assert await get_value("email_to_id:b@example.com") == "u-new"
+    assert await rebuild_user_indexes() is None
+
+
+@pytest.mark.asyncio
+async def test_github_callback_survives_email_list_failure(client: AsyncClient):
+    """A failing /user/emails call should not fail a login whose profile has an email."""
+    import httpx
+    from app.services.redis_service import find_user_by_index, provider_index_key
+
+    def reply(body: bytes):
+        return MagicMock(status_code=200, content=body)
+
+    async def fake_get(url, headers=None):
+        if url.endswith("/user/emails"):
+            raise httpx.ConnectError("boom")
+        return reply(b'{"id": 42, "login": "octo", "name": "Octo", "email": "octo@example.com"}')
+
+    http = MagicMock()
+    http.post = AsyncMock(return_value=reply(b'{"access_token": "gho_x"}'))
+    http.get = fake_get
+    with patch("app.routers.auth.get_http_client", return_value=http):
+        response = await client.get("/auth/github/callback?code=abc", follow_redirects=False)
+    assert response.status_code in (302, 307)
+    user = await find_user_by_index(provider_index_key("github", "42"))
+    assert user["email"] == "octo@example.com"
+
+
+@pytest.mark.asyncio
+async def test_google_callback_uses_shared_http_client(client: AsyncClient):
+    """Google logins should exchange the code through the shared HTTP client."""
+    from app.services.redis_service import find_user_by_index, provider_index_key
+
+    http = MagicMock()
+    http.post = AsyncMock(return_value=MagicMock(status_code=200, content=b'{"access_token": "ya29.x"}'))
+    http.get = AsyncMock(return_value=MagicMock(
+        status_code=200, content=b'{"sub": "g-7", "email": "g@example.com", "name": "Gee"}',
+    ))
+    with patch("app.routers.auth.get_http_client", return_value=http):
+        response = await client.get("/auth/google/callback?code=abc", follow_redirects=False)
+    assert response.status_code in (302, 307)
+    assert http.post.call_args.kwargs["data"]["code"] == "abc"
+    assert http.get.call_args.kwargs["headers"]["Authorization"] == "Bearer ya29.x"
+    user = await find_user_by_index(provider_index_key("google", "g-7"))
+    assert user["email"] == "g@example.com"
+
+
+@pytest.mark.asyncio
+async def test_google_callback_rejects_failed_exchange(client: AsyncClient):
+    """An error reply from the token endpoint should surface as a 400."""
+    http = MagicMock()
+    http.post = AsyncMock(return_value=MagicMock(status_code=400, content=b'{"error": "invalid_grant"}'))
+    with patch("app.routers.auth.get_http_client", return_value=http):
+        response = await client.get("/auth/google/callback?code=bad", follow_redirects=False)
+    assert response.status_code == 400
+    assert "invalid_grant" in response.json()["detail"]
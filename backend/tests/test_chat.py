@@ -209,3 +209,32 @@ async def test_list_my_rooms(client: AsyncClient, test_user, admin_user):
     # All returned rooms should include the test user
     for room in rooms:
         assert user["id"] in room["members"]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_failed_sockets(test_user):
+    """A socket that fails to send should be dropped without affecting the others."""
+    from app.routers import chat
+
+    user, _ = test_user
+    room = {"id": "room-1", "name": "Lab", "members": [user["id"]], "created_at": "2024-01-01T00:00:00+00:00"}
+    await chat.json_set("room:room-1", ".", room)
+    good, bad = AsyncMock(), AsyncMock()
+    bad.send_text.side_effect = RuntimeError("socket closed")
+    chat._ws_connections["room-1"] = {(user["id"], good), (user["id"], bad)}
+    try:
+        await chat._persist_and_broadcast(room, chat._build_message("room-1", user, "hi"))
+        good.send_text.assert_awaited_once()
+        assert chat._ws_connections["room-1"] == {(user["id"], good)}
+    finally:
+        chat._ws_connections.pop("room-1", None)
+
+
+def test_unregister_last_connection_drops_room():
+    """Rooms with no open sockets should not linger in the registry."""
+    from app.routers import chat
+
+    conn = ("user-1", object())
+    chat._ws_connections["room-2"] = {conn}
+    chat._unregister_connection("room-2", conn)
+    assert "room-2" not in chat._ws_connections
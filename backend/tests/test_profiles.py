@@ -1,6 +1,7 @@
 """Tests for profile management endpoints."""
 import pytest
 from httpx import AsyncClient
+from unittest.mock import patch, AsyncMock
 
 
 @pytest.mark.asyncio
@@ -77,6 +78,19 @@ async def test_list_profiles(client: AsyncClient, test_user):
     assert any(p["user_id"] == user["id"] for p in profiles)
 
 
+@pytest.mark.asyncio
+async def test_update_profile_unchanged_skips_write(client: AsyncClient, test_user):
+    """Re-saving identical data should return the stored profile without rewriting it."""
+    _, token = test_user
+    headers = {"Authorization": f"Bearer {token}"}
+    first = await client.put("/profiles/me", json={"data": {"bio": "Same"}}, headers=headers)
+    with patch("app.routers.profiles.json_set", new_callable=AsyncMock) as mock_set:
+        second = await client.put("/profiles/me", json={"data": {"bio": "Same"}}, headers=headers)
+    assert second.status_code == 200
+    assert second.json()["updated_at"] == first.json()["updated_at"]
+    mock_set.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_list_profiles_with_search(client: AsyncClient, test_user):
     """GET /profiles/?search=... should filter results."""
@@ -101,6 +115,62 @@ async def test_list_profiles_with_search(client: AsyncClient, test_user):
     assert response_no_match.json() == []
 
 
+@pytest.mark.asyncio
+async def test_list_profiles_search_sees_profile_updates(client: AsyncClient, test_user):
+    """A repeated search should reflect profile edits made since the last one."""
+    _, token = test_user
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.put("/profiles/me", json={"data": {"bio": "Botanist"}}, headers=headers)
+    response = await client.get("/profiles/?search=%20Botanist%07", headers=headers)
+    assert len(response.json()) == 1
+
+    await client.put("/profiles/me", json={"data": {"bio": "Geologist"}}, headers=headers)
+    response = await client.get("/profiles/?search=botanist", headers=headers)
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_list_profiles_search_without_stored_text(client: AsyncClient, test_user):
+    """Profiles saved before search text was stored should still be searchable."""
+    from app.services.redis_service import json_set
+
+    _, token = test_user
+    await json_set("profile:legacy", ".", {
+        "user_id": "legacy",
+        "user_name": "Old Timer",
+        "avatar_url": None,
+        "data": {"bio": "Likes Astrophysics"},
+        "updated_at": "2024-01-01T00:00:00+00:00",
+    })
+    response = await client.get(
+        "/profiles/?search=astrophysics",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert [p["user_id"] for p in response.json()] == ["legacy"]
+
+
+@pytest.mark.asyncio
+async def test_list_profiles_search_limit(client: AsyncClient, test_user):
+    """Search results should be capped by the limit query parameter."""
+    from app.services.redis_service import json_set
+
+    _, token = test_user
+    for i in range(5):
+        await json_set(f"profile:member-{i}", ".", {
+            "user_id": f"member-{i}",
+            "user_name": f"Member {i}",
+            "avatar_url": None,
+            "data": {"bio": "Stargazer"},
+            "updated_at": "2024-01-01T00:00:00+00:00",
+        })
+    response = await client.get(
+        "/profiles/?search=stargazer&limit=3",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+
+
 @pytest.mark.asyncio
 async def test_get_profile_by_id(client: AsyncClient, test_user):
     """GET /profiles/{user_id} should return that user's profile."""
@@ -154,6 +224,36 @@ async def test_delete_account(client: AsyncClient, test_user):
     assert me_response.status_code in (401, 404)
 
 
+@pytest.mark.asyncio
+async def test_delete_account_leaves_rooms(client: AsyncClient, test_user, admin_user):
+    """DELETE /profiles/me should drop the user from shared rooms and delete solo rooms."""
+    from app.services.redis_service import json_get, json_set
+    user, token = test_user
+    admin, _ = admin_user
+    await json_set("room:shared", ".", {"id": "shared", "members": [user["id"], admin["id"]]})
+    await json_set("room:solo", ".", {"id": "solo", "members": [user["id"]]})
+    await json_set("room:other", ".", {"id": "other", "members": [admin["id"]]})
+
+    response = await client.delete("/profiles/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 204
+    assert (await json_get("room:shared"))["members"] == [admin["id"]]
+    assert await json_get("room:solo") is None
+    assert (await json_get("room:other"))["members"] == [admin["id"]]
+
+
+@pytest.mark.asyncio
+async def test_update_profile_deleted_user_skips_flag(client: AsyncClient, test_user):
+    """Saving a profile for a cached but deleted user must not field-SET a missing doc."""
+    import app.services.redis_service as rs
+    user, token = test_user
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.get("/auth/me", headers=headers)  # warm the user cache
+    rs._redis._store.pop(f"user:{user['id']}")
+    response = await client.put("/profiles/me", json={"data": {"name": "Ghost"}}, headers=headers)
+    assert response.status_code == 200
+    assert f"user:{user['id']}" not in rs._redis._store
+
+
 @pytest.mark.asyncio
 async def test_profile_requires_auth(client: AsyncClient):
     """Profile endpoints should require authentication."""
@@ -0,0 +1,58 @@
+"""Tests for Redis service helpers."""
+import asyncio
+from types import SimpleNamespace
+import pytest
+from redis.asyncio.connection import Connection
+
+
+class _OfflineConnection(Connection):
+    """Pooled connection that never touches the network."""
+
+    async def connect(self):
+        pass
+
+    async def can_read(self, timeout=0):
+        return False
+
+    async def disconnect(self, nowait=False):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_pool_waits_for_a_free_connection_past_the_cap():
+    """More concurrent operations than max_connections should queue, not fail."""
+    from app.services.redis_service import _connection_pool
+
+    settings = SimpleNamespace(
+        redis_url="redis://localhost:6379",
+        redis_username="",
+        redis_password="",
+        redis_max_connections=2,
+        redis_pool_timeout=5,
+    )
+    pool = _connection_pool(settings)
+    pool.connection_class = _OfflineConnection
+
+    async def operation():
+        conn = await pool.get_connection()
+        await asyncio.sleep(0.01)
+        await pool.release(conn)
+
+    await asyncio.gather(*(operation() for _ in range(10)))
+    assert len(pool._available_connections) + len(pool._in_use_connections) <= 2
+
+
+@pytest.mark.asyncio
+async def test_json_get_fields_single_and_multiple_paths():
+    """One field gets a bare JSONPath array back; several get a path map."""
+    from app.services.redis_service import json_get_fields, json_set
+
+    await json_set("doc:1", ".", {"name": "Ada", "email": "ada@example.com"})
+    await json_set("doc:2", ".", {"email": "bob@example.com"})
+    keys = ["doc:1", "doc:2", "doc:missing"]
+    assert await json_get_fields(keys, ["name"]) == [{"name": "Ada"}, {"name": None}, None]
+    assert await json_get_fields(keys, ("name", "email")) == [
+        {"name": "Ada", "email": "ada@example.com"},
+        {"name": None, "email": "bob@example.com"},
+        None,
+    ]
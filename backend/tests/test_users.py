@@ -20,6 +20,29 @@ async def test_list_users(client: AsyncClient, test_user, admin_user):
     for u in users:
         assert "provider_id" not in u
         assert "is_admin" not in u
+        assert set(u) == {"id", "name", "avatar_url", "created_at"}
+
+
+@pytest.mark.asyncio
+async def test_list_users_is_gzipped(client: AsyncClient, test_user):
+    """Large list responses should be compressed when the client accepts gzip."""
+    from app.services.redis_service import json_set
+
+    _, token = test_user
+    for i in range(40):
+        await json_set(f"user:member-{i}", ".", {
+            "id": f"member-{i}",
+            "name": f"Member {i}",
+            "avatar_url": None,
+            "created_at": "2024-01-01T00:00:00+00:00",
+        })
+    response = await client.get(
+        "/users/",
+        headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 41
 
 
 @pytest.mark.asyncio
@@ -67,10 +90,9 @@ async def test_notification_service_sends_push(client: AsyncClient, test_user):
     """Notification service should call ntfy.sh with correct parameters."""
     from app.services.notification_service import send_push_notification
 
-    with patch("app.services.notification_service.httpx.AsyncClient") as mock_client_cls:
+    with patch("app.services.notification_service.get_http_client") as mock_get_client:
         mock_client = AsyncMock()
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client
         mock_client.post = AsyncMock(return_value=AsyncMock(status_code=200))
 
         result = await send_push_notification(
@@ -92,3 +114,56 @@ async def test_users_require_auth(client: AsyncClient):
 
     response = await client.put("/users/me/ntfy", json={"ntfy_topic": "test"})
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_update_ntfy_topic_unchanged_skips_write(client: AsyncClient, test_user):
+    """Saving the topic that is already stored should not rewrite the user."""
+    _, token = test_user
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.put("/users/me/ntfy", json={"ntfy_topic": "same-topic"}, headers=headers)
+    with patch("app.routers.users.json_set_fields", new_callable=AsyncMock) as mock_set:
+        response = await client.put("/users/me/ntfy", json={"ntfy_topic": "same-topic"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["ntfy_topic"] == "same-topic"
+    mock_set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_ntfy_topic_deleted_user_404(client: AsyncClient, test_user):
+    """A user still authenticated from the cache but gone from Redis gets a 404."""
+    import app.services.redis_service as rs
+    user, token = test_user
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.get("/auth/me", headers=headers)  # warm the user cache
+    rs._redis._store.pop(f"user:{user['id']}")
+    response = await client.put("/users/me/ntfy", json={"ntfy_topic": "t"}, headers=headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_ntfy_topic_visible_to_cached_reads(client: AsyncClient, test_user):
+    """Writes to a user must evict it from the in-process user cache."""
+    _, token = test_user
+    headers = {"Authorization": f"Bearer {token}"}
+    # Prime the cache through an authenticated read
+    assert (await client.get("/auth/me", headers=headers)).status_code == 200
+    await client.put("/users/me/ntfy", json={"ntfy_topic": "fresh-topic"}, headers=headers)
+    response = await client.get("/auth/me", headers=headers)
+    assert response.json()["ntfy_topic"] == "fresh-topic"
+
+
+@pytest.mark.asyncio
+async def test_background_notification_failure_is_logged(caplog):
+    """A failing background notification should be logged and released."""
+    import asyncio
+    from app.services import notification_service
+
+    async def boom():
+        raise RuntimeError("ntfy down")
+
+    task = notification_service.run_in_background(boom())
+    await asyncio.gather(task, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert task not in notification_service._background_tasks
+    assert "Background notification failed" in caplog.text
@@ -6,9 +6,11 @@ import { GestureHandlerRootView } from 'react-native-gesture-handler';
 import { SafeAreaProvider } from 'react-native-safe-area-context';
 import RootNavigator from './src/navigation/RootNavigator';
 
+const ROOT_STYLE = { flex: 1 };
+
 export default function App() {
     return (
-        <GestureHandlerRootView style={{ flex: 1 }}>
+        <GestureHandlerRootView style={ROOT_STYLE}>
             <SafeAreaProvider>
                 <StatusBar style="light" />
                 <RootNavigator />
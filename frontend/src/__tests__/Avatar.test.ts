@@ -0,0 +1,30 @@
+/**
+ * Tests for the Avatar placeholder initial.
+ */
+import { initialOf } from '../components/shared/Avatar';
+
+describe('initialOf', () => {
+  it('keeps Hangul syllables whole', () => {
+    expect(initialOf('김민수')).toBe('김');
+  });
+
+  it('keeps kana voicing marks', () => {
+    expect(initialOf('ガンダム')).toBe('ガ');
+    expect(initialOf('\u30ab\u3099ンダム')).toBe('ガ');
+  });
+
+  it('upper-cases accented Latin letters, precomposed or not', () => {
+    expect(initialOf('élodie')).toBe('É');
+    expect(initialOf('e\u0301lodie')).toBe('É');
+  });
+
+  it('does not split emoji into surrogates', () => {
+    expect(initialOf('😀 Smile')).toBe('😀');
+  });
+
+  it('falls back to "?" for empty names', () => {
+    expect(initialOf('')).toBe('?');
+    expect(initialOf('   ')).toBe('?');
+    expect(initialOf(null)).toBe('?');
+  });
+});
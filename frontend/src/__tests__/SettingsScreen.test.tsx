@@ -20,7 +20,10 @@ const mockUser = {
 };
 
 jest.mock('../store/authStore', () => ({
-  useAuthStore: () => ({ user: mockUser, logout: mockLogout }),
+  useAuthStore: (selector?: (s: any) => any) => {
+    const state = { user: mockUser, logout: mockLogout };
+    return selector ? selector(state) : state;
+  },
 }));
 
 jest.mock('../services/api', () => ({
@@ -72,6 +75,19 @@ describe('SettingsScreen', () => {
     );
   });
 
+  it('signs out without waiting for the account delete to finish', async () => {
+    const api = require('../services/api').default;
+    api.delete.mockReturnValueOnce(new Promise(() => {}));
+    const { getByText } = render(<SettingsScreen />);
+    fireEvent.press(getByText('Delete My Account'));
+    const buttons = (Alert.alert as jest.Mock).mock.calls[0][2];
+    buttons.find((b: any) => b.style === 'destructive').onPress();
+    await waitFor(() => {
+      expect(api.delete).toHaveBeenCalledWith('/profiles/me', expect.any(Object));
+      expect(mockLogout).toHaveBeenCalled();
+    });
+  });
+
   it('calls logout when sign out is pressed', async () => {
     const { getByText } = render(<SettingsScreen />);
     fireEvent.press(getByText('Sign Out'));
@@ -55,3 +55,50 @@ describe('API base URL', () => {
     expect(WS_BASE).toMatch(/^ws/);
   });
 });
+
+describe('cachedGet', () => {
+  it('shares one request between concurrent callers and caches the result', async () => {
+    const api = require('../services/api');
+    const get = jest.spyOn(api.default, 'get').mockResolvedValue({ data: { ok: true } });
+    const [a, b] = await Promise.all([api.cachedGet('/cached'), api.cachedGet('/cached')]);
+    const c = await api.cachedGet('/cached');
+    expect(a).toEqual({ ok: true });
+    expect(b).toBe(a);
+    expect(c).toBe(a);
+    expect(get).toHaveBeenCalledTimes(1);
+    get.mockRestore();
+  });
+});
+
+describe('peekCached', () => {
+  it('returns cached data without a request and undefined on a miss', async () => {
+    const api = require('../services/api');
+    const get = jest.spyOn(api.default, 'get').mockResolvedValue({ data: { id: 'u1' } });
+    expect(api.peekCached('/peeked')).toBeUndefined();
+    await api.cachedGet('/peeked');
+    expect(api.peekCached('/peeked')).toEqual({ id: 'u1' });
+    api.invalidateCached('/peeked');
+    expect(api.peekCached('/peeked')).toBeUndefined();
+    expect(get).toHaveBeenCalledTimes(1);
+    get.mockRestore();
+  });
+});
+
+describe('cache reset on sign-in/out', () => {
+  it('does not hand a previous session\'s in-flight response to the next session', async () => {
+    const api = require('../services/api');
+    let resolveOld: (v: any) => void = () => {};
+    const get = jest
+      .spyOn(api.default, 'get')
+      .mockReturnValueOnce(new Promise((r) => { resolveOld = r; }))
+      .mockResolvedValue({ data: { id: 'new' } });
+    const old = api.cachedGet('/session-me');
+    await api.clearToken();
+    const fresh = await api.cachedGet('/session-me');
+    expect(fresh).toEqual({ id: 'new' });
+    resolveOld({ data: { id: 'old' } });
+    await expect(old).resolves.toEqual({ id: 'new' });
+    expect(api.peekCached('/session-me')).toEqual({ id: 'new' });
+    get.mockRestore();
+  });
+});
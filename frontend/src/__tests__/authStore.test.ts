@@ -92,4 +92,15 @@ describe('useAuthStore', () => {
     expect(useAuthStore.getState().user).toBeNull();
     expect(useAuthStore.getState().token).toBeNull();
   });
+
+  it('should ignore a second email login while one is in flight', async () => {
+    (api.post as jest.Mock).mockResolvedValueOnce({ data: { access_token: 'tok', user: mockUser } });
+    await act(async () => {
+      const first = useAuthStore.getState().loginWithEmail('test@example.com', 'pw');
+      const second = useAuthStore.getState().loginWithEmail('test@example.com', 'pw');
+      await Promise.all([first, second]);
+    });
+    expect(api.post).toHaveBeenCalledTimes(1);
+    expect(useAuthStore.getState().user).toEqual(mockUser);
+  });
 });
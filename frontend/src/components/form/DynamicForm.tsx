@@ -20,6 +20,7 @@ import {
 import Slider from '@react-native-community/slider';
 import * as ImagePicker from 'expo-image-picker';
 import { Colors, Spacing, FontSize, Radius } from '../../utils/theme';
+import { stripHtml } from '../../utils/html';
 import { Button } from '../shared/Button';
 import MapField from './MapField';
 import RichTextEditor from './RichTextEditor';
@@ -304,7 +305,7 @@ export default function DynamicForm({
 
 function Label({ html }: { html: string }) {
   // Strip basic HTML tags for native rendering
-  const plain = html.replace(/<[^>]+>/g, '');
+  const plain = stripHtml(html);
   return <Text style={styles.label}>{plain}</Text>;
 }
 
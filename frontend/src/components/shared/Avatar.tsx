@@ -0,0 +1,59 @@
+import React, { memo } from 'react';
+import { View, Text, Image, StyleSheet, ViewStyle } from 'react-native';
+import { Colors, FontSize } from '../../utils/theme';
+
+interface AvatarProps {
+  uri?: string | null;
+  name: string;
+  size?: number;
+  style?: ViewStyle;
+}
+
+// Round frame per size, built once and shared by every avatar of that size
+const shapeCache = new Map<number, { width: number; height: number; borderRadius: number }>();
+function shapeFor(size: number) {
+  let shape = shapeCache.get(size);
+  if (!shape) {
+    shape = { width: size, height: size, borderRadius: size / 2 };
+    shapeCache.set(size, shape);
+  }
+  return shape;
+}
+
+/**
+ * First character of a name for avatar placeholders. Composes to NFC first so
+ * "e\u0301", Hangul jamo and kana voicing marks fold into one letter, then drops
+ * any mark still left standalone. Works on code points so emoji and astral
+ * letters are not split into lone surrogates; "?" when empty.
+ */
+export function initialOf(name?: string | null): string {
+  const [first] = Array.from((name ?? '').trim().normalize('NFC').replace(/\p{M}/gu, ''));
+  return first ? first.toUpperCase() : '?';
+}
+
+/**
+ * Profile picture, or the first letter of the name on a coloured disc.
+ * Memoised: props are plain strings, numbers and StyleSheet entries, so a
+ * parent re-render with the same person doesn't rebuild the image or disc.
+ */
+export const Avatar = memo(function Avatar({ uri, name, size = 48, style }: AvatarProps) {
+  const shape = shapeFor(size);
+  if (uri) {
+    return <Image source={{ uri }} style={[shape, style as any]} />;
+  }
+  return (
+    <View style={[styles.fallback, shape, style]}>
+      <Text style={size >= 56 ? styles.initialLarge : styles.initial}>{initialOf(name)}</Text>
+    </View>
+  );
+});
+
+const styles = StyleSheet.create({
+  fallback: {
+    backgroundColor: Colors.primary,
+    alignItems: 'center',
+    justifyContent: 'center',
+  },
+  initial: { color: Colors.white, fontSize: FontSize.lg, fontWeight: '700' },
+  initialLarge: { color: Colors.white, fontSize: FontSize.xl, fontWeight: '700' },
+});
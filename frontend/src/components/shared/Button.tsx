@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { memo } from 'react';
 import {
   TouchableOpacity,
   Text,
@@ -19,7 +19,9 @@ interface ButtonProps {
   textStyle?: TextStyle;
 }
 
-export const Button: React.FC<ButtonProps> = ({
+// Memoised: with a stable onPress, a parent re-render (e.g. typing in a nearby
+// input) leaves the button alone
+export const Button = memo(function Button({
   title,
   onPress,
   variant = 'primary',
@@ -27,28 +29,19 @@ export const Button: React.FC<ButtonProps> = ({
   disabled = false,
   style,
   textStyle,
-}) => {
-  const containerStyle = [
-    styles.base,
-    variant === 'primary' && styles.primary,
-    variant === 'secondary' && styles.secondary,
-    variant === 'outline' && styles.outline,
-    variant === 'danger' && styles.danger,
-    (disabled || loading) && styles.disabled,
-    style,
-  ];
-
-  const labelStyle = [
-    styles.label,
-    variant === 'outline' && styles.outlineLabel,
-    textStyle,
-  ];
+}: ButtonProps) {
+  const inactive = disabled || loading;
+  // Plain buttons reuse their variant's shared style; only overrides build a new array
+  const containerStyle = inactive || style
+    ? [CONTAINER_STYLES[variant], inactive && styles.disabled, style]
+    : CONTAINER_STYLES[variant];
+  const labelStyle = textStyle ? [LABEL_STYLES[variant], textStyle] : LABEL_STYLES[variant];
 
   return (
     <TouchableOpacity
       style={containerStyle}
       onPress={onPress}
-      disabled={disabled || loading}
+      disabled={inactive}
       activeOpacity={0.8}
     >
       {loading ? (
@@ -58,7 +51,7 @@ export const Button: React.FC<ButtonProps> = ({
       )}
     </TouchableOpacity>
   );
-};
+});
 
 const styles = StyleSheet.create({
   base: {
@@ -85,3 +78,17 @@ const styles = StyleSheet.create({
   },
   outlineLabel: { color: Colors.primary },
 });
+
+type Variant = NonNullable<ButtonProps['variant']>;
+const CONTAINER_STYLES: Record<Variant, ViewStyle[]> = {
+  primary: [styles.base, styles.primary],
+  secondary: [styles.base, styles.secondary],
+  outline: [styles.base, styles.outline],
+  danger: [styles.base, styles.danger],
+};
+const LABEL_STYLES: Record<Variant, TextStyle | TextStyle[]> = {
+  primary: styles.label,
+  secondary: styles.label,
+  outline: [styles.label, styles.outlineLabel],
+  danger: styles.label,
+};
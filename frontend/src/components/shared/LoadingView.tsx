@@ -0,0 +1,16 @@
+import React, { memo } from 'react';
+import { View, ActivityIndicator, StyleSheet } from 'react-native';
+import { Colors } from '../../utils/theme';
+
+/** Full-area spinner shown while a screen loads. Takes no props, so it never re-renders. */
+export const LoadingView = memo(function LoadingView() {
+  return (
+    <View style={styles.center}>
+      <ActivityIndicator size="large" color={Colors.primary} />
+    </View>
+  );
+});
+
+const styles = StyleSheet.create({
+  center: { flex: 1, backgroundColor: Colors.background, alignItems: 'center', justifyContent: 'center' },
+});
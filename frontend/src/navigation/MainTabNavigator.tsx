@@ -9,29 +9,33 @@ import ExperimentsScreen from '../screens/ExperimentsScreen';
 import ChatListScreen from '../screens/ChatListScreen';
 import SettingsScreen from '../screens/SettingsScreen';
 const Tab = createBottomTabNavigator();
+// Tab name -> [focused icon, unfocused icon]
+const TAB_ICONS: Record<string, [string, string]> = {
+    Profile: ['person', 'person-outline'],
+    Community: ['people', 'people-outline'],
+    Experiments: ['flask', 'flask-outline'],
+    Chat: ['chatbubbles', 'chatbubbles-outline'],
+    Settings: ['settings', 'settings-outline'],
+};
+const TAB_BAR_STYLE = {
+    backgroundColor: Colors.surface,
+    borderTopColor: Colors.border,
+};
+// Built once; only the icon renderer depends on the route
+const screenOptions = ({ route }: { route: { name: string } }) => ({
+    headerShown: false,
+    // Tabs stay mounted once visited; freeze hidden ones so they don't re-render
+    freezeOnBlur: true,
+    tabBarStyle: TAB_BAR_STYLE,
+    tabBarActiveTintColor: Colors.primary,
+    tabBarInactiveTintColor: Colors.textMuted,
+    tabBarIcon: ({ focused, color, size }: { focused: boolean; color: string; size: number }) => (
+        <Ionicons name={TAB_ICONS[route.name][focused ? 0 : 1] as any} size={size} color={color} />
+    ),
+});
 export default function MainTabNavigator() {
     return (
-        <Tab.Navigator
-            screenOptions={({ route }) => ({
-                headerShown: false,
-                tabBarStyle: {
-                    backgroundColor: Colors.surface,
-                    borderTopColor: Colors.border,
-                },
-                tabBarActiveTintColor: Colors.primary,
-                tabBarInactiveTintColor: Colors.textMuted,
-                tabBarIcon: ({ focused, color, size }) => {
-                    const icons: Record<string, string> = {
-                        Profile: focused ? 'person' : 'person-outline',
-                        Community: focused ? 'people' : 'people-outline',
-                        Experiments: focused ? 'flask' : 'flask-outline',
-                        Chat: focused ? 'chatbubbles' : 'chatbubbles-outline',
-                        Settings: focused ? 'settings' : 'settings-outline',
-                    };
-                    return <Ionicons name={icons[route.name] as any} size={size} color={color} />;
-                },
-            })}
-        >
+        <Tab.Navigator screenOptions={screenOptions}>
             <Tab.Screen name="Profile" component={ProfileScreen} />
             <Tab.Screen name="Community" component={CommunityScreen} />
             <Tab.Screen name="Experiments" component={ExperimentsScreen} />
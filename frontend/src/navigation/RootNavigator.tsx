@@ -1,7 +1,7 @@
 import React, { useEffect } from 'react';
 import { NavigationContainer } from '@react-navigation/native';
 import { createStackNavigator } from '@react-navigation/stack';
-import { ActivityIndicator, View } from 'react-native';
+import { ActivityIndicator, StyleSheet, View } from 'react-native';
 
 import { useAuthStore } from '../store/authStore';
 import { getToken } from '../services/api';
@@ -9,14 +9,25 @@ import { Colors } from '../utils/theme';
 
 import LoginScreen from '../screens/LoginScreen';
 import AuthCallbackScreen from '../screens/AuthCallbackScreen';
-import MainTabNavigator from './MainTabNavigator';
-import ProfileDetailScreen from '../screens/ProfileDetailScreen';
-import ChatRoomScreen from '../screens/ChatRoomScreen';
-import ExperimentDetailScreen from '../screens/ExperimentDetailScreen';
-import ExperimentEditorScreen from '../screens/ExperimentEditorScreen';
+
+// Signed-in screens are required on first navigation, so a cold start that
+// lands on Login doesn't evaluate the main app's modules
+const getMainTabNavigator = () => require('./MainTabNavigator').default;
+const getProfileDetailScreen = () => require('../screens/ProfileDetailScreen').default;
+const getChatRoomScreen = () => require('../screens/ChatRoomScreen').default;
+const getExperimentDetailScreen = () => require('../screens/ExperimentDetailScreen').default;
+const getExperimentEditorScreen = () => require('../screens/ExperimentEditorScreen').default;
 
 const Stack = createStackNavigator();
 
+// Stable across renders, so a user/auth change doesn't hand the navigator
+// fresh options and id callbacks for every screen
+const STACK_SCREEN_OPTIONS = { headerShown: false };
+// getId keys each detail screen by its record, so revisiting one reuses the mounted screen
+const profileId = ({ params }: any) => params?.userId;
+const roomId = ({ params }: any) => params?.roomId;
+const experimentId = ({ params }: any) => params?.experimentId;
+
 const linking = {
   prefixes: ['otherus://', 'http://localhost:8080', 'https://otherus.app'],
   config: {
@@ -41,7 +52,10 @@ const linking = {
 };
 
 export default function RootNavigator() {
-  const { user, isLoading, fetchMe } = useAuthStore();
+  // Select only what the navigator needs so isLoading/error churn during
+  // startup and login doesn't re-render the whole navigation tree
+  const user = useAuthStore((s) => s.user);
+  const fetchMe = useAuthStore((s) => s.fetchMe);
   const [initializing, setInitializing] = React.useState(true);
 
   useEffect(() => {
@@ -57,7 +71,7 @@ export default function RootNavigator() {
 
   if (initializing) {
     return (
-      <View style={{ flex: 1, backgroundColor: Colors.background, alignItems: 'center', justifyContent: 'center' }}>
+      <View style={styles.splash}>
         <ActivityIndicator size="large" color={Colors.primary} />
       </View>
     );
@@ -65,14 +79,14 @@ export default function RootNavigator() {
 
   return (
     <NavigationContainer linking={linking}>
-      <Stack.Navigator screenOptions={{ headerShown: false }}>
+      <Stack.Navigator screenOptions={STACK_SCREEN_OPTIONS}>
         {user ? (
           <>
-            <Stack.Screen name="Main" component={MainTabNavigator} />
-            <Stack.Screen name="ProfileDetail" component={ProfileDetailScreen} />
-            <Stack.Screen name="ChatRoom" component={ChatRoomScreen} />
-            <Stack.Screen name="ExperimentDetail" component={ExperimentDetailScreen} />
-            <Stack.Screen name="ExperimentEditor" component={ExperimentEditorScreen} />
+            <Stack.Screen name="Main" getComponent={getMainTabNavigator} />
+            <Stack.Screen name="ProfileDetail" getComponent={getProfileDetailScreen} getId={profileId} />
+            <Stack.Screen name="ChatRoom" getComponent={getChatRoomScreen} getId={roomId} />
+            <Stack.Screen name="ExperimentDetail" getComponent={getExperimentDetailScreen} getId={experimentId} />
+            <Stack.Screen name="ExperimentEditor" getComponent={getExperimentEditorScreen} />
           </>
         ) : (
           <>
@@ -84,3 +98,7 @@ export default function RootNavigator() {
     </NavigationContainer>
   );
 }
+
+const styles = StyleSheet.create({
+  splash: { flex: 1, backgroundColor: Colors.background, alignItems: 'center', justifyContent: 'center' },
+});
@@ -5,7 +5,6 @@ import {
     FlatList,
     StyleSheet,
     TouchableOpacity,
-    ActivityIndicator,
     Alert,
 } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
@@ -15,7 +14,10 @@ import { Card } from '../components/shared/Card';
 import { Button } from '../components/shared/Button';
 import api from '../services/api';
 import { useAuthStore } from '../store/authStore';
+import { LoadingView } from '../components/shared/LoadingView';
 
+// Shared by every row instead of a fresh options object per render
+const TIME_FORMAT: Intl.DateTimeFormatOptions = { hour: '2-digit', minute: '2-digit' };
 interface Room {
     id: string;
     type: string;
@@ -76,11 +78,11 @@ export default function ChatListScreen() {
                     <View style={styles.roomIcon}>
                         <Text style={styles.roomIconText}>{item.type === 'group' ? '👥' : '💬'}</Text>
                     </View>
-                    <View style={{ flex: 1 }}>
+                    <View style={styles.roomInfo}>
                         <Text style={styles.roomName}>{item.name}</Text>
                         {item.last_message ? (
                             <Text style={styles.lastMessage} numberOfLines={1}>
-                                <Text style={{ fontWeight: '600' }}>{item.last_message.sender_name}: </Text>
+                                <Text style={styles.lastSender}>{item.last_message.sender_name}: </Text>
                                 {item.last_message.content}
                             </Text>
                         ) : (
@@ -89,7 +91,7 @@ export default function ChatListScreen() {
                     </View>
                     {item.last_message && (
                         <Text style={styles.time}>
-                            {new Date(item.last_message.created_at).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}
+                            {new Date(item.last_message.created_at).toLocaleTimeString([], TIME_FORMAT)}
                         </Text>
                     )}
                 </View>
@@ -110,9 +112,7 @@ export default function ChatListScreen() {
             </View>
 
             {loading ? (
-                <View style={styles.center}>
-                    <ActivityIndicator size="large" color={Colors.primary} />
-                </View>
+                <LoadingView />
             ) : (
                 <FlatList
                     data={rooms}
@@ -133,7 +133,6 @@ export default function ChatListScreen() {
 
 const styles = StyleSheet.create({
     container: { flex: 1, backgroundColor: Colors.background },
-    center: { flex: 1, alignItems: 'center', justifyContent: 'center' },
     header: {
         flexDirection: 'row',
         alignItems: 'center',
@@ -158,8 +157,10 @@ const styles = StyleSheet.create({
         justifyContent: 'center',
     },
     roomIconText: { fontSize: 20 },
+    roomInfo: { flex: 1 },
     roomName: { color: Colors.text, fontSize: FontSize.md, fontWeight: '600' },
     lastMessage: { color: Colors.textMuted, fontSize: FontSize.sm, marginTop: 2 },
+    lastSender: { fontWeight: '600' },
     time: { color: Colors.textMuted, fontSize: FontSize.xs },
     emptyContainer: { alignItems: 'center', paddingTop: Spacing.xxl, paddingHorizontal: Spacing.xl },
     empty: { color: Colors.textMuted, fontSize: FontSize.md, textAlign: 'center' },
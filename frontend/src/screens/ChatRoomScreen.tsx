@@ -8,13 +8,16 @@ import {
     TouchableOpacity,
     KeyboardAvoidingView,
     Platform,
-    ActivityIndicator,
 } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 import { useNavigation, useRoute } from '@react-navigation/native';
 import { Colors, Spacing, FontSize, Radius } from '../utils/theme';
 import api, { WS_BASE, getToken } from '../services/api';
 import { useAuthStore } from '../store/authStore';
+import { initialOf } from '../components/shared/Avatar';
+import { LoadingView } from '../components/shared/LoadingView';
+// Shared by every row instead of a fresh options object per render
+const TIME_FORMAT: Intl.DateTimeFormatOptions = { hour: '2-digit', minute: '2-digit' };
 interface Message {
     id: string;
     room_id: string;
@@ -38,17 +41,28 @@ export default function ChatRoomScreen() {
 
     // Load message history
     useEffect(() => {
+        // Cleared on unmount or room change so a late response is dropped
+        let active = true;
         const load = async () => {
             try {
                 const res = await api.get(`/chat/rooms/${roomId}/messages`);
-                setMessages(res.data ?? []);
+                if (!active) return;
+                const history: Message[] = res.data ?? [];
+                // Keep anything the WebSocket delivered while history was loading
+                setMessages((prev) => {
+                    const seen = new Set(history.map((m) => m.id));
+                    return [...history, ...prev.filter((m) => !seen.has(m.id))];
+                });
             } catch {
-                setMessages([]);
+                // Leave any live messages in place
             } finally {
-                setLoading(false);
+                if (active) setLoading(false);
             }
         };
         load();
+        return () => {
+            active = false;
+        };
     }, [roomId]);
 
     // Connect WebSocket
@@ -66,7 +80,6 @@ export default function ChatRoomScreen() {
                         if (prev.find((m) => m.id === msg.id)) return prev;
                         return [...prev, msg];
                     });
-                    setTimeout(() => listRef.current?.scrollToEnd({ animated: true }), 100);
                 } catch { }
             };
             ws.onerror = (e) => console.error('WS error', e);
@@ -105,14 +118,14 @@ export default function ChatRoomScreen() {
             <View style={[styles.msgRow, isMe && styles.msgRowMe]}>
                 {!isMe && (
                     <View style={styles.msgAvatar}>
-                        <Text style={styles.msgAvatarText}>{item.sender_name[0]?.toUpperCase()}</Text>
+                        <Text style={styles.msgAvatarText}>{initialOf(item.sender_name)}</Text>
                     </View>
                 )}
                 <View style={[styles.msgBubble, isMe ? styles.msgBubbleMe : styles.msgBubbleOther]}>
                     {!isMe && <Text style={styles.msgSender}>{item.sender_name}</Text>}
                     <Text style={styles.msgContent}>{item.content}</Text>
                     <Text style={styles.msgTime}>
-                        {new Date(item.created_at).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}
+                        {new Date(item.created_at).toLocaleTimeString([], TIME_FORMAT)}
                     </Text>
                 </View>
             </View>
@@ -127,14 +140,12 @@ export default function ChatRoomScreen() {
                     <Text style={styles.backText}>←</Text>
                 </TouchableOpacity>
                 <Text style={styles.roomName} numberOfLines={1}>{roomName}</Text>
-                <View style={{ width: 32 }} />
+                <View style={styles.headerSpacer} />
             </View>
 
             {/* Messages */}
             {loading ? (
-                <View style={styles.center}>
-                    <ActivityIndicator size="large" color={Colors.primary} />
-                </View>
+                <LoadingView />
             ) : (
                 <FlatList
                     ref={listRef}
@@ -180,7 +191,6 @@ export default function ChatRoomScreen() {
 
 const styles = StyleSheet.create({
     container: { flex: 1, backgroundColor: Colors.background },
-    center: { flex: 1, alignItems: 'center', justifyContent: 'center' },
     header: {
         flexDirection: 'row',
         alignItems: 'center',
@@ -191,6 +201,7 @@ const styles = StyleSheet.create({
         gap: Spacing.sm,
     },
     backText: { color: Colors.primary, fontSize: FontSize.xl, width: 32 },
+    headerSpacer: { width: 32 },
     roomName: { flex: 1, color: Colors.text, fontSize: FontSize.md, fontWeight: '700', textAlign: 'center' },
     messageList: { padding: Spacing.md, paddingBottom: Spacing.sm },
     msgRow: { flexDirection: 'row', marginBottom: Spacing.sm, alignItems: 'flex-end' },
@@ -2,7 +2,7 @@
  * CommunityScreen — shows aggregated profile data as radar charts,
  * lists all member profiles, and supports search/filter.
  */
-import React, { useEffect, useState, useMemo } from 'react';
+import React, { useEffect, useState, useMemo, useCallback, useRef, memo } from 'react';
 import {
     View,
     Text,
@@ -10,16 +10,17 @@ import {
     FlatList,
     StyleSheet,
     TouchableOpacity,
-    ActivityIndicator,
-    Image,
     Platform,
     ScrollView,
 } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 import { useNavigation } from '@react-navigation/native';
 import { Colors, Spacing, FontSize, Radius } from '../utils/theme';
+import { stripHtml } from '../utils/html';
 import api from '../services/api';
 import { Card } from '../components/shared/Card';
+import { Avatar } from '../components/shared/Avatar';
+import { LoadingView } from '../components/shared/LoadingView';
 
 // ── Radar chart (web only via Chart.js; native fallback) ──────────────────────
 
@@ -60,6 +61,9 @@ if (Platform.OS === 'web') {
     );
 }
 
+// Filtering waits this long after the last keystroke
+const SEARCH_DEBOUNCE_MS = 300;
+
 // ── Types ──────────────────────────────────────────────────────────────────────
 
 interface Profile {
@@ -72,6 +76,29 @@ interface Profile {
 
 // ── Helpers ────────────────────────────────────────────────────────────────────
 
+const EMPTY_CHART: { labels: string[]; avg: number[] } = { labels: [], avg: [] };
+// Radar series styling; translucent fills of the theme's primary and secondary colours
+const WANTS_SERIES = {
+    label: 'Community Average',
+    backgroundColor: 'rgba(108, 99, 255, 0.2)',
+    borderColor: Colors.primary,
+    borderWidth: 2,
+};
+const SHARING_SERIES = {
+    label: 'Community Average',
+    backgroundColor: 'rgba(255, 101, 132, 0.2)',
+    borderColor: Colors.secondary,
+    borderWidth: 2,
+};
+// Rows show two lines of the ideas text; anything past this is never visible
+const SNIPPET_LENGTH = 160;
+
+function makeSnippet(html: unknown): string | undefined {
+    if (typeof html !== 'string' || !html) return undefined;
+    const text = stripHtml(html);
+    return text.length <= SNIPPET_LENGTH ? text : text.slice(0, SNIPPET_LENGTH);
+}
+
 function extractSliderValues(profiles: Profile[], groupKey: string): { labels: string[]; avg: number[] } {
     if (!profiles.length) return { labels: [], avg: [] };
     const first = profiles.find((p) => p.data?.[groupKey]?.items);
@@ -90,67 +117,120 @@ function extractSliderValues(profiles: Profile[], groupKey: string): { labels: s
     });
     return { labels, avg };
 }
+// ── Member row ─────────────────────────────────────────────────────────────────
+// Memoised so re-filtering only renders rows that weren't on screen before
+const MemberRow = memo(function MemberRow({
+    item,
+    snippet,
+    onPress,
+}: {
+    item: Profile;
+    snippet?: string;
+    onPress: (userId: string) => void;
+}) {
+    return (
+        <TouchableOpacity onPress={() => onPress(item.user_id)}>
+            <Card style={styles.memberCard}>
+                <View style={styles.memberRow}>
+                    {/* Prefer the uploaded profile image, then the provider avatar */}
+                    <Avatar uri={item.data?.profile_image || item.avatar_url} name={item.user_name} />
+                    <View style={styles.memberInfo}>
+                        <Text style={styles.memberName}>{item.user_name}</Text>
+                        {snippet ? (
+                            <Text style={styles.memberSnippet} numberOfLines={2}>
+                                {snippet}
+                            </Text>
+                        ) : null}
+                    </View>
+                </View>
+            </Card>
+        </TouchableOpacity>
+    );
+});
 // ── Component ──────────────────────────────────────────────────────────────────
 export default function CommunityScreen() {
     const navigation = useNavigation<any>();
     const [profiles, setProfiles] = useState<Profile[]>([]);
     const [loading, setLoading] = useState(true);
     const [search, setSearch] = useState('');
+    // The list filters on this copy, which trails the input by SEARCH_DEBOUNCE_MS
+    const [debouncedSearch, setDebouncedSearch] = useState('');
     const [activeTab, setActiveTab] = useState<'members' | 'charts'>('members');
+    // Latches on the first visit to the charts tab and never resets
+    const [chartsOpened, setChartsOpened] = useState(false);
     useEffect(() => {
+        // Cleared on unmount so a late response doesn't update a dead screen
+        let active = true;
         const load = async () => {
             try {
                 const res = await api.get('/profiles/');
-                setProfiles(res.data ?? []);
+                if (active) setProfiles(res.data ?? []);
             } catch {
-                setProfiles([]);
+                if (active) setProfiles([]);
             } finally {
-                setLoading(false);
+                if (active) setLoading(false);
             }
         };
         load();
+        return () => {
+            active = false;
+        };
     }, []);
+    useEffect(() => {
+        const timer = setTimeout(() => setDebouncedSearch(search), SEARCH_DEBOUNCE_MS);
+        return () => clearTimeout(timer);
+    }, [search]);
+    // Lowercased searchable text per profile, built once per load instead of per query
+    const searchIndex = useMemo(
+        () => profiles.map((p) => `${p.user_name}\n${JSON.stringify(p.data)}`.toLowerCase()),
+        [profiles]
+    );
+    // Indices matched by the previous query; a refinement that extends it
+    // ("ali" -> "alice") only needs to re-check those
+    const lastMatch = useRef<{ index: string[]; query: string; hits: number[] } | null>(null);
     const filtered = useMemo(() => {
-        if (!search.trim()) return profiles;
-        const q = search.toLowerCase();
-        return profiles.filter(
-            (p) =>
-                p.user_name.toLowerCase().includes(q) ||
-                JSON.stringify(p.data).toLowerCase().includes(q)
-        );
-    }, [profiles, search]);
-    const wantsChart = useMemo(() => extractSliderValues(profiles, 'wants'), [profiles]);
-    const sharingChart = useMemo(() => extractSliderValues(profiles, 'sharing'), [profiles]);
-    const renderMember = ({ item }: { item: Profile }) => {
-        // Get the profile image - check profile_image in data first, then fall back to avatar_url
-        const profileImage = item.data?.profile_image || item.avatar_url;
-        
-        return (
-            <TouchableOpacity
-                onPress={() => navigation.navigate('ProfileDetail', { userId: item.user_id })}
-            >
-                <Card style={styles.memberCard}>
-                    <View style={styles.memberRow}>
-                        {profileImage ? (
-                            <Image source={{ uri: profileImage }} style={styles.avatar} />
-                        ) : (
-                            <View style={styles.avatarFallback}>
-                                <Text style={styles.avatarInitial}>{item.user_name[0]?.toUpperCase()}</Text>
-                            </View>
-                        )}
-                        <View style={{ flex: 1 }}>
-                            <Text style={styles.memberName}>{item.user_name}</Text>
-                            {item.data?.transhumanist_ideas ? (
-                                <Text style={styles.memberSnippet} numberOfLines={2}>
-                                    {item.data.transhumanist_ideas.replace(/<[^>]+>/g, '')}
-                                </Text>
-                            ) : null}
-                        </View>
-                    </View>
-                </Card>
-            </TouchableOpacity>
-        );
-    };
+        if (!debouncedSearch.trim()) {
+            lastMatch.current = null;
+            return profiles;
+        }
+        const q = debouncedSearch.toLowerCase();
+        const prev = lastMatch.current;
+        const candidates =
+            prev && prev.index === searchIndex && q.startsWith(prev.query)
+                ? prev.hits
+                : searchIndex.map((_, i) => i);
+        const hits = candidates.filter((i) => searchIndex[i].includes(q));
+        lastMatch.current = { index: searchIndex, query: q, hits };
+        return hits.map((i) => profiles[i]);
+    }, [profiles, searchIndex, debouncedSearch]);
+    // Chart averages wait until the charts tab is first opened, then are
+    // computed once per profiles load however often the tabs are switched
+    const wantsChart = useMemo(
+        () => (chartsOpened ? extractSliderValues(profiles, 'wants') : EMPTY_CHART),
+        [profiles, chartsOpened]
+    );
+    const sharingChart = useMemo(
+        () => (chartsOpened ? extractSliderValues(profiles, 'sharing') : EMPTY_CHART),
+        [profiles, chartsOpened]
+    );
+    // Datasets only change with the averages, so typing in search doesn't hand the charts new props
+    const wantsDatasets = useMemo(() => [{ ...WANTS_SERIES, data: wantsChart.avg }], [wantsChart]);
+    const sharingDatasets = useMemo(() => [{ ...SHARING_SERIES, data: sharingChart.avg }], [sharingChart]);
+    const openProfile = useCallback(
+        (userId: string) => navigation.navigate('ProfileDetail', { userId }),
+        [navigation]
+    );
+    // Stripped, truncated ideas text per member, built once per profile load
+    const snippets = useMemo(
+        () => new Map(profiles.map((p) => [p.user_id, makeSnippet(p.data?.transhumanist_ideas)])),
+        [profiles]
+    );
+    const renderMember = useCallback(
+        ({ item }: { item: Profile }) => (
+            <MemberRow item={item} snippet={snippets.get(item.user_id)} onPress={openProfile} />
+        ),
+        [openProfile, snippets]
+    );
     return (
         <SafeAreaView style={styles.container} edges={['top']}>
             {/* Header */}
@@ -178,22 +258,29 @@ export default function CommunityScreen() {
                 </TouchableOpacity>
                 <TouchableOpacity
                     style={[styles.tab, activeTab === 'charts' && styles.activeTab]}
-                    onPress={() => setActiveTab('charts')}
+                    onPress={() => {
+                        setActiveTab('charts');
+                        setChartsOpened(true);
+                    }}
                 >
                     <Text style={[styles.tabText, activeTab === 'charts' && styles.activeTabText]}>Aggregate Charts</Text>
                 </TouchableOpacity>
             </View>
 
             {loading ? (
-                <View style={styles.center}>
-                    <ActivityIndicator size="large" color={Colors.primary} />
-                </View>
+                <LoadingView />
             ) : activeTab === 'members' ? (
                 <FlatList
                     data={filtered}
                     keyExtractor={(item) => item.user_id}
                     renderItem={renderMember}
                     contentContainerStyle={styles.list}
+                    // Mount roughly a screen of rows up front and keep a small window
+                    // around the viewport so large communities stay cheap to scroll
+                    initialNumToRender={12}
+                    maxToRenderPerBatch={12}
+                    windowSize={7}
+                    removeClippedSubviews={Platform.OS !== 'web'}
                     ListEmptyComponent={
                         <Text style={styles.empty}>No members found.</Text>
                     }
@@ -206,33 +293,17 @@ export default function CommunityScreen() {
                             {wantsChart.labels.length > 0 ? (
                                 <RadarChart
                                     labels={wantsChart.labels}
-                                    datasets={[
-                                        {
-                                            label: 'Community Average',
-                                            data: wantsChart.avg,
-                                            backgroundColor: 'rgba(108, 99, 255, 0.2)',
-                                            borderColor: '#6C63FF',
-                                            borderWidth: 2,
-                                        },
-                                    ]}
+                                    datasets={wantsDatasets}
                                 />
                             ) : (
                                 <Text style={styles.empty}>No data yet.</Text>
                             )}
 
-                            <Text style={[styles.chartTitle, { marginTop: Spacing.xl }]}>Sharing Comfort (avg)</Text>
+                            <Text style={[styles.chartTitle, styles.chartTitleSpaced]}>Sharing Comfort (avg)</Text>
                             {sharingChart.labels.length > 0 ? (
                                 <RadarChart
                                     labels={sharingChart.labels}
-                                    datasets={[
-                                        {
-                                            label: 'Community Average',
-                                            data: sharingChart.avg,
-                                            backgroundColor: 'rgba(255, 101, 132, 0.2)',
-                                            borderColor: '#FF6584',
-                                            borderWidth: 2,
-                                        },
-                                    ]}
+                                    datasets={sharingDatasets}
                                 />
                             ) : (
                                 <Text style={styles.empty}>No data yet.</Text>
@@ -251,7 +322,6 @@ export default function CommunityScreen() {
 
 const styles = StyleSheet.create({
     container: { flex: 1, backgroundColor: Colors.background },
-    center: { flex: 1, alignItems: 'center', justifyContent: 'center' },
     header: {
         paddingHorizontal: Spacing.md,
         paddingTop: Spacing.md,
@@ -291,19 +361,11 @@ const styles = StyleSheet.create({
     list: { padding: Spacing.md, paddingTop: 0 },
     memberCard: { marginBottom: Spacing.sm },
     memberRow: { flexDirection: 'row', alignItems: 'center', gap: Spacing.md },
-    avatar: { width: 48, height: 48, borderRadius: 24 },
-    avatarFallback: {
-        width: 48,
-        height: 48,
-        borderRadius: 24,
-        backgroundColor: Colors.primary,
-        alignItems: 'center',
-        justifyContent: 'center',
-    },
-    avatarInitial: { color: Colors.white, fontSize: FontSize.lg, fontWeight: '700' },
+    memberInfo: { flex: 1 },
     memberName: { color: Colors.text, fontSize: FontSize.md, fontWeight: '600' },
     memberSnippet: { color: Colors.textMuted, fontSize: FontSize.sm, marginTop: 2 },
     empty: { color: Colors.textMuted, textAlign: 'center', marginTop: Spacing.xl },
     chartsContainer: { padding: Spacing.md, paddingBottom: Spacing.xxl },
     chartTitle: { color: Colors.text, fontSize: FontSize.lg, fontWeight: '700', marginBottom: Spacing.md },
+    chartTitleSpaced: { marginTop: Spacing.xl },
 });
@@ -4,7 +4,6 @@ import {
     Text,
     ScrollView,
     StyleSheet,
-    ActivityIndicator,
     TouchableOpacity,
     Platform,
 } from 'react-native';
@@ -14,6 +13,7 @@ import { Colors, Spacing, FontSize, Radius } from '../utils/theme';
 import api from '../services/api';
 import { useAuthStore } from '../store/authStore';
 import { Button } from '../components/shared/Button';
+import { LoadingView } from '../components/shared/LoadingView';
 
 interface Experiment {
     id: string;
@@ -34,25 +34,27 @@ export default function ExperimentDetailScreen() {
     const [loading, setLoading] = useState(true);
 
     useEffect(() => {
+        // Cleared on unmount or when experimentId changes, so a response that
+        // lands after the user has left doesn't update a detached screen
+        let current = true;
         const load = async () => {
             try {
                 const res = await api.get(`/experiments/${experimentId}`);
-                setExperiment(res.data);
+                if (current) setExperiment(res.data);
             } catch {
-                setExperiment(null);
+                if (current) setExperiment(null);
             } finally {
-                setLoading(false);
+                if (current) setLoading(false);
             }
         };
         load();
+        return () => {
+            current = false;
+        };
     }, [experimentId]);
 
     if (loading) {
-        return (
-            <View style={styles.center}>
-                <ActivityIndicator size="large" color={Colors.primary} />
-            </View>
-        );
+        return <LoadingView />;
     }
 
     if (!experiment) {
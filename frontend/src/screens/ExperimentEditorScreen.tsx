@@ -5,7 +5,6 @@ import {
     TextInput,
     ScrollView,
     StyleSheet,
-    ActivityIndicator,
     TouchableOpacity,
     Alert,
 } from 'react-native';
@@ -15,6 +14,7 @@ import { Colors, Spacing, FontSize, Radius } from '../utils/theme';
 import { Button } from '../components/shared/Button';
 import RichTextEditor from '../components/form/RichTextEditor';
 import api from '../services/api';
+import { LoadingView } from '../components/shared/LoadingView';
 
 export default function ExperimentEditorScreen() {
     const navigation = useNavigation<any>();
@@ -76,11 +76,7 @@ export default function ExperimentEditorScreen() {
     };
 
     if (loading) {
-        return (
-            <View style={styles.center}>
-                <ActivityIndicator size="large" color={Colors.primary} />
-            </View>
-        );
+        return <LoadingView />;
     }
 
     return (
@@ -154,7 +150,6 @@ export default function ExperimentEditorScreen() {
 
 const styles = StyleSheet.create({
     container: { flex: 1, backgroundColor: Colors.background },
-    center: { flex: 1, backgroundColor: Colors.background, alignItems: 'center', justifyContent: 'center' },
     header: {
         flexDirection: 'row',
         alignItems: 'center',
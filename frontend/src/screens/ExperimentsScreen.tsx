@@ -5,7 +5,6 @@ import {
     FlatList,
     StyleSheet,
     TouchableOpacity,
-    ActivityIndicator,
 } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 import { useNavigation } from '@react-navigation/native';
@@ -14,6 +13,7 @@ import { Card } from '../components/shared/Card';
 import { Button } from '../components/shared/Button';
 import api from '../services/api';
 import { useAuthStore } from '../store/authStore';
+import { LoadingView } from '../components/shared/LoadingView';
 interface Experiment {
     id: string;
     title: string;
@@ -99,9 +99,7 @@ export default function ExperimentsScreen() {
             </View>
 
             {loading ? (
-                <View style={styles.center}>
-                    <ActivityIndicator size="large" color={Colors.primary} />
-                </View>
+                <LoadingView />
             ) : (
                 <FlatList
                     data={filtered}
@@ -123,7 +121,6 @@ export default function ExperimentsScreen() {
 
 const styles = StyleSheet.create({
     container: { flex: 1, backgroundColor: Colors.background },
-    center: { flex: 1, alignItems: 'center', justifyContent: 'center' },
     header: {
         flexDirection: 'row',
         alignItems: 'center',
@@ -14,13 +14,33 @@ import { Button } from '../components/shared/Button';
 import { Colors, Spacing, FontSize, Radius } from '../utils/theme';
 import { useAuthStore } from '../store/authStore';
 import { API_BASE } from '../services/api';
+interface Credentials {
+    email: string;
+    password: string;
+    name: string;
+}
+const EMPTY_CREDENTIALS: Credentials = { email: '', password: '', name: '' };
+const GOOGLE_LOGIN_URL = `${API_BASE}/auth/google/login`;
+const GITHUB_LOGIN_URL = `${API_BASE}/auth/github/login`;
+// On web the backend redirect is followed in place; native apps hand off to the browser
+const openOAuth = async (url: string) => {
+    if (typeof window !== 'undefined' && window.location) {
+        window.location.href = url;
+    } else {
+        await Linking.openURL(url);
+    }
+};
+const handleGoogleLogin = () => openOAuth(GOOGLE_LOGIN_URL);
+const handleGitHubLogin = () => openOAuth(GITHUB_LOGIN_URL);
 export default function LoginScreen() {
     const navigation = useNavigation<any>();
     const { user, isLoading, error, loginWithEmail, registerWithEmail } = useAuthStore();
     const [isRegisterMode, setIsRegisterMode] = useState(false);
-    const [email, setEmail] = useState('');
-    const [password, setPassword] = useState('');
-    const [name, setName] = useState('');
+    // One state object so clearing the form on a mode switch is a single update
+    const [{ email, password, name }, setCredentials] = useState<Credentials>(EMPTY_CREDENTIALS);
+    const setEmail = (value: string) => setCredentials((c) => ({ ...c, email: value }));
+    const setPassword = (value: string) => setCredentials((c) => ({ ...c, password: value }));
+    const setName = (value: string) => setCredentials((c) => ({ ...c, name: value }));
     const [showEmailForm, setShowEmailForm] = useState(false);
     useEffect(() => {
         if (user) {
@@ -42,44 +62,18 @@ export default function LoginScreen() {
             Alert.alert('Error', err.message || 'Authentication failed');
         }
     };
-    const handleGoogleLogin = async () => {
-        const url = `${API_BASE}/auth/google/login`;
-        if (typeof window !== 'undefined' && window.location) {
-            window.location.href = url;
-        } else {
-            await Linking.openURL(url);
-        }
-    };
-    const handleGitHubLogin = async () => {
-        const url = `${API_BASE}/auth/github/login`;
-        if (typeof window !== 'undefined' && window.location) {
-            window.location.href = url;
-        } else {
-            await Linking.openURL(url);
-        }
-    };
     const toggleMode = () => {
         setIsRegisterMode(!isRegisterMode);
-        setEmail('');
-        setPassword('');
-        setName('');
+        setCredentials(EMPTY_CREDENTIALS);
     };
     const toggleEmailForm = () => {
         setShowEmailForm(!showEmailForm);
-        setEmail('');
-        setPassword('');
-        setName('');
         setIsRegisterMode(false);
+        setCredentials(EMPTY_CREDENTIALS);
     };
     return (
         <ScrollView contentContainerStyle={styles.container}>
-            <View style={styles.hero}>
-                <Text style={styles.logo}></Text>
-                <Text style={styles.title}>Other Us</Text>
-                <Text style={styles.subtitle}>
-                    A community for exploring collaborative research.
-                </Text>
-            </View>
+            {HERO}
             <View style={styles.authBox}>
                 <Text style={styles.authTitle}>
                     {showEmailForm
@@ -140,21 +134,13 @@ export default function LoginScreen() {
                             onPress={toggleEmailForm}
                             style={styles.emailBtn}
                         />
-                        <View style={styles.divider}>
-                            <View style={styles.dividerLine} />
-                            <Text style={styles.dividerText}>or</Text>
-                            <View style={styles.dividerLine} />
-                        </View>
+                        {DIVIDER}
                         <Button
                             title="Continue with Google"
                             onPress={handleGoogleLogin}
                             style={styles.googleBtn}
                         />
-                        <View style={styles.divider}>
-                            <View style={styles.dividerLine} />
-                            <Text style={styles.dividerText}>or</Text>
-                            <View style={styles.dividerLine} />
-                        </View>
+                        {DIVIDER}
                         <Button
                             title="Continue with GitHub"
                             onPress={handleGitHubLogin}
@@ -164,9 +150,7 @@ export default function LoginScreen() {
                     </>
                 )}
 
-                <Text style={styles.disclaimer}>
-                    By signing in, you agree to our Terms of Service and Privacy Policy.
-                </Text>
+                {DISCLAIMER}
             </View>
         </ScrollView>
     );
@@ -280,3 +264,25 @@ const styles = StyleSheet.create({
         lineHeight: 16,
     },
 });
+// Static blocks are built once; React skips reconciling an element it rendered before
+const HERO = (
+    <View style={styles.hero}>
+        <Text style={styles.logo}></Text>
+        <Text style={styles.title}>Other Us</Text>
+        <Text style={styles.subtitle}>
+            A community for exploring collaborative research.
+        </Text>
+    </View>
+);
+const DIVIDER = (
+    <View style={styles.divider}>
+        <View style={styles.dividerLine} />
+        <Text style={styles.dividerText}>or</Text>
+        <View style={styles.dividerLine} />
+    </View>
+);
+const DISCLAIMER = (
+    <Text style={styles.disclaimer}>
+        By signing in, you agree to our Terms of Service and Privacy Policy.
+    </Text>
+);
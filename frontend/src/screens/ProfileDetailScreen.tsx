@@ -1,12 +1,11 @@
 /**
  * ProfileDetailScreen — displays a specific user's profile with all their data.
  */
-import React, { useEffect, useState } from 'react';
+import React, { memo, useEffect, useState } from 'react';
 import {
     View,
     Text,
     StyleSheet,
-    ActivityIndicator,
     TouchableOpacity,
     Image,
     ScrollView,
@@ -14,9 +13,12 @@ import {
 import { SafeAreaView } from 'react-native-safe-area-context';
 import { useNavigation, useRoute } from '@react-navigation/native';
 import { Colors, Spacing, FontSize, Radius } from '../utils/theme';
-import api from '../services/api';
+import { stripHtml } from '../utils/html';
+import api, { cachedGet, peekCached } from '../services/api';
 import { Card } from '../components/shared/Card';
+import { Avatar } from '../components/shared/Avatar';
 import ReadOnlyMapField from '../components/form/ReadOnlyMapField';
+import { LoadingView } from '../components/shared/LoadingView';
 
 interface Profile {
     user_id: string;
@@ -25,30 +27,75 @@ interface Profile {
     data: Record<string, any>;
     updated_at: string;
 }
+// Profile, spinner and error change together, so they live in one state
+// object and each load step is a single update and a single render
+interface LoadState {
+    profile: Profile | null;
+    loading: boolean;
+    error: string | null;
+}
+const LOADING: LoadState = { profile: null, loading: true, error: null };
+// Going back and forth between Community and a profile reuses the last fetch for this long
+const PROFILE_TTL_MS = 60000;
+
+function initialState(userId: string): LoadState {
+    const cached = peekCached<Profile>(`/profiles/${userId}`);
+    return cached ? { profile: cached, loading: false, error: null } : LOADING;
+}
+
+/** False for blank answers, so sparse profiles don't render a card per empty field. */
+function hasContent(value: any): boolean {
+    if (value === null || value === undefined) return false;
+    if (typeof value === 'string') return stripHtml(value).trim() !== '';
+    if (Array.isArray(value)) return value.length > 0;
+    if (typeof value === 'object') return Object.keys(value).length > 0;
+    return true;
+}
+
+// Stays mounted across loading, error and profile views; takes no props, so it never
+// re-renders along with the screen
+const BackHeader = memo(function BackHeader() {
+    const navigation = useNavigation<any>();
+    return (
+        <View style={styles.header}>
+            <TouchableOpacity onPress={() => navigation.goBack()}>
+                <Text style={styles.backButton}>← Back</Text>
+            </TouchableOpacity>
+        </View>
+    );
+});
+
 export default function ProfileDetailScreen() {
     const navigation = useNavigation<any>();
     const route = useRoute<any>();
     const { userId } = route.params;
 
-    const [profile, setProfile] = useState<Profile | null>(null);
-    const [loading, setLoading] = useState(true);
-    const [error, setError] = useState<string | null>(null);
+    // A cached profile renders on the first frame, with no spinner in between
+    const [{ profile, loading, error }, setState] = useState<LoadState>(() => initialState(userId));
 
     useEffect(() => {
+        // Superseded when userId changes or the screen unmounts; a slow response
+        // for the previous profile must not overwrite the current one
+        let current = true;
         const loadProfile = async () => {
+            const cached = initialState(userId);
+            // Reuse the current state when it already matches (first mount or a
+            // cache hit for the same profile) so it doesn't render twice
+            setState((s) => (s.loading === cached.loading && s.profile === cached.profile ? s : cached));
+            if (!cached.loading) return;
             try {
-                setLoading(true);
-                const res = await api.get(`/profiles/${userId}`);
-                setProfile(res.data);
-                setError(null);
+                const data = await cachedGet<Profile>(`/profiles/${userId}`, PROFILE_TTL_MS);
+                if (!current) return;
+                setState({ profile: data, loading: false, error: null });
             } catch (err: any) {
-                setError(err.response?.data?.detail || 'Failed to load profile');
-                setProfile(null);
-            } finally {
-                setLoading(false);
+                if (!current) return;
+                setState({ profile: null, loading: false, error: err.response?.data?.detail || 'Failed to load profile' });
             }
         };
         loadProfile();
+        return () => {
+            current = false;
+        };
     }, [userId]);
 
     const handleMessage = async () => {
@@ -66,54 +113,30 @@ export default function ProfileDetailScreen() {
         }
     };
 
+    // One shell and header for every state; only the body below the header is swapped
+    let body: React.ReactNode;
     if (loading) {
-        return (
-            <SafeAreaView style={styles.container} edges={['top']}>
-                <View style={styles.center}>
-                    <ActivityIndicator size="large" color={Colors.primary} />
-                </View>
-            </SafeAreaView>
+        body = (
+            <LoadingView />
         );
-    }
-
-    if (error || !profile) {
-        return (
-            <SafeAreaView style={styles.container} edges={['top']}>
-                <View style={styles.header}>
-                    <TouchableOpacity onPress={() => navigation.goBack()}>
-                        <Text style={styles.backButton}>← Back</Text>
-                    </TouchableOpacity>
-                </View>
-                <View style={styles.center}>
-                    <Text style={styles.errorText}>{error || 'Profile not found'}</Text>
-                </View>
-            </SafeAreaView>
-        );
-    }
-    // Get the profile image - check profile_image in data first, then fall back to avatar_url
-    const profileImage = profile.data?.profile_image || profile.avatar_url;
-
-    return (
-        <SafeAreaView style={styles.container} edges={['top']}>
-            {/* Header */}
-            <View style={styles.header}>
-                <TouchableOpacity onPress={() => navigation.goBack()}>
-                    <Text style={styles.backButton}>← Back</Text>
-                </TouchableOpacity>
+    } else if (error || !profile) {
+        body = (
+            <View style={styles.center}>
+                <Text style={styles.errorText}>{error || 'Profile not found'}</Text>
             </View>
+        );
+    } else {
+        body = (
             <ScrollView contentContainerStyle={styles.content}>
                 {/* Avatar & Name */}
                 <View style={styles.profileHeader}>
-                    {profileImage ? (
-                        <Image
-                            source={{ uri: profileImage }}
-                            style={styles.avatar}
-                        />
-                    ) : (
-                        <View style={styles.avatarFallback}>
-                            <Text style={styles.avatarInitial}>{profile.user_name[0]?.toUpperCase()}</Text>
-                        </View>
-                    )}
+                    {/* Prefer the uploaded profile image, then the provider avatar */}
+                    <Avatar
+                        uri={profile.data?.profile_image || profile.avatar_url}
+                        name={profile.user_name}
+                        size={80}
+                        style={styles.avatar}
+                    />
                     <Text style={styles.name}>{profile.user_name}</Text>
                     <Text style={styles.updated}>Updated: {new Date(profile.updated_at).toLocaleDateString()}</Text>
                 </View>
@@ -124,7 +147,7 @@ export default function ProfileDetailScreen() {
                 </TouchableOpacity>
 
                 {/* Profile Data */}
-                {Object.entries(profile.data).map(([key, value]) => {
+                {Object.entries(profile.data).filter(([, value]) => hasContent(value)).map(([key, value]) => {
                     // Check if this is an image field (base64 data URI)
                     const isImage = typeof value === 'string' && value.startsWith('data:image/');
                     // Check if this is a map field (has lat and lng properties)
@@ -138,7 +161,7 @@ export default function ProfileDetailScreen() {
                             ) : isMap ? (
                                 <ReadOnlyMapField lat={value.lat} lng={value.lng} />
                             ) : typeof value === 'string' ? (
-                                <Text style={styles.dataValue}>{value.replace(/<[^>]+>/g, '')}</Text>
+                                <Text style={styles.dataValue}>{stripHtml(value)}</Text>
                             ) : typeof value === 'object' && value !== null ? (
                                 <View>
                                     {value.items ? (
@@ -161,6 +184,12 @@ export default function ProfileDetailScreen() {
                     );
                 })}
             </ScrollView>
+        );
+    }
+    return (
+        <SafeAreaView style={styles.container} edges={['top']}>
+            <BackHeader />
+            {body}
         </SafeAreaView>
     );
 }
@@ -184,17 +213,7 @@ const styles = StyleSheet.create({
         alignItems: 'center',
         marginBottom: Spacing.lg,
     },
-    avatar: { width: 80, height: 80, borderRadius: 40, marginBottom: Spacing.md },
-    avatarFallback: {
-        width: 80,
-        height: 80,
-        borderRadius: 40,
-        backgroundColor: Colors.primary,
-        alignItems: 'center',
-        justifyContent: 'center',
-        marginBottom: Spacing.md,
-    },
-    avatarInitial: { color: Colors.white, fontSize: FontSize.xl, fontWeight: '700' },
+    avatar: { marginBottom: Spacing.md },
     name: { fontSize: FontSize.xl, fontWeight: '700', color: Colors.text, textAlign: 'center' },
     updated: { fontSize: FontSize.sm, color: Colors.textMuted, marginTop: Spacing.xs },
     messageButton: {
@@ -11,14 +11,14 @@ import {
     View,
     Text,
     StyleSheet,
-    ActivityIndicator,
 } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 import { useAuthStore } from '../store/authStore';
 import { Colors, Spacing, FontSize } from '../utils/theme';
 import DynamicForm from '../components/form/DynamicForm';
 import { PROFILE_SCHEMA } from '../utils/profileSchema';
-import api from '../services/api';
+import api, { cachedGet, invalidateCached } from '../services/api';
+import { LoadingView } from '../components/shared/LoadingView';
 
 type SaveStatus = 'idle' | 'pending' | 'saving' | 'saved' | 'error';
 
@@ -35,42 +35,61 @@ export default function ProfileScreen() {
     const debounceTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
     // Latest values ref — avoids stale closure in the debounced save
     const latestValues = useRef<Record<string, any>>({});
+    // Serialised form of what the server last confirmed, for the dirty check
+    const lastSavedJson = useRef<string | null>(null);
 
     // ── Load existing profile on mount ─────────────────────────────────────────
     useEffect(() => {
+        // Cleared on unmount so a late response doesn't update a dead screen
+        let active = true;
         const load = async () => {
             try {
-                const res = await api.get('/profiles/me');
-                const data = res.data?.data ?? {};
+                const profile = await cachedGet('/profiles/me');
+                if (!active) return;
+                const data = profile?.data ?? {};
                 setInitialValues(data);
                 latestValues.current = data;
+                lastSavedJson.current = JSON.stringify(data);
             } catch {
-                setInitialValues({});
+                if (active) setInitialValues({});
             } finally {
-                setLoading(false);
+                if (active) setLoading(false);
             }
         };
         load();
 
         // Cleanup debounce timer on unmount
         return () => {
+            active = false;
             if (debounceTimer.current) clearTimeout(debounceTimer.current);
         };
     }, []);
 
     // ── Persist to API ──────────────────────────────────────────────────────────
     const saveNow = useCallback(async (values: Record<string, any>) => {
+        // Edits that end up back where they started don't need a round-trip
+        const json = JSON.stringify(values);
+        if (json === lastSavedJson.current) {
+            setSaveStatus('idle');
+            return;
+        }
         setSaveStatus('saving');
         try {
             await api.put('/profiles/me', { data: values });
+            invalidateCached('/profiles/me');
+            // Our own public profile page is cached under the user id too
+            const me = useAuthStore.getState().user;
+            if (me) invalidateCached(`/profiles/${me.id}`);
+            lastSavedJson.current = json;
             setSaveStatus('saved');
-            // Reset to 'idle' after 3 seconds so the indicator fades away
-            setTimeout(() => setSaveStatus('idle'), 3000);
+            // Reset to 'idle' after 3 seconds so the indicator fades away — unless
+            // a newer edit has moved the status on, in which case this is a no-op
+            setTimeout(() => setSaveStatus((s) => (s === 'saved' ? 'idle' : s)), 3000);
         } catch (err: any) {
             setErrorMsg(err?.response?.data?.detail ?? 'Save failed');
             setSaveStatus('error');
             // Allow retry after 4 seconds
-            setTimeout(() => setSaveStatus('idle'), 4000);
+            setTimeout(() => setSaveStatus((s) => (s === 'error' ? 'idle' : s)), 4000);
         }
     }, []);
 
@@ -103,11 +122,7 @@ export default function ProfileScreen() {
 
     // ── Render ──────────────────────────────────────────────────────────────────
     if (loading) {
-        return (
-            <View style={styles.center}>
-                <ActivityIndicator size="large" color={Colors.primary} />
-            </View>
-        );
+        return <LoadingView />;
     }
 
     return (
@@ -138,12 +153,6 @@ export default function ProfileScreen() {
 
 const styles = StyleSheet.create({
     container: { flex: 1, backgroundColor: Colors.background },
-    center: {
-        flex: 1,
-        backgroundColor: Colors.background,
-        alignItems: 'center',
-        justifyContent: 'center',
-    },
     header: {
         paddingHorizontal: Spacing.md,
         paddingTop: Spacing.md,
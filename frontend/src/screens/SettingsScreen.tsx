@@ -1,11 +1,10 @@
-import React, { useState } from 'react';
+import React, { useCallback, useState } from 'react';
 import {
     View,
     Text,
     StyleSheet,
     ScrollView,
     Alert,
-    Image,
     TextInput,
     Platform,
 } from 'react-native';
@@ -14,17 +13,19 @@ import { useNavigation } from '@react-navigation/native';
 import { Colors, Spacing, FontSize, Radius } from '../utils/theme';
 import { Button } from '../components/shared/Button';
 import { Card } from '../components/shared/Card';
+import { Avatar } from '../components/shared/Avatar';
 import { useAuthStore } from '../store/authStore';
-import api from '../services/api';
-function confirmAction(
-    title: string,
-    message: string,
-    onConfirm: () => void,
-    onCancel?: () => void,
-): void {
+import api, { getToken } from '../services/api';
+const DELETE_TITLE = '⚠️ Delete Account';
+const DELETE_MESSAGE =
+    'This action is permanent and cannot be undone. All your profile data, messages, and account information will be permanently deleted. Are you absolutely sure?';
+// Web's window.confirm takes a single string
+const DELETE_PROMPT = `${DELETE_TITLE}\n\n${DELETE_MESSAGE}`;
+
+function confirmDelete(onConfirm: () => void, onCancel?: () => void): void {
     if (Platform.OS !== 'web') {
         // Native path — Alert.alert works perfectly here.
-        Alert.alert(title, message, [
+        Alert.alert(DELETE_TITLE, DELETE_MESSAGE, [
             { text: 'Cancel', style: 'cancel', onPress: onCancel },
             { text: 'Yes, Delete My Account', style: 'destructive', onPress: onConfirm },
         ]);
@@ -32,7 +33,7 @@ function confirmAction(
     }
 
     // Web path — use window.confirm (synchronous, always available in browsers).
-    const confirmed = window.confirm(`${title}\n\n${message}`);
+    const confirmed = window.confirm(DELETE_PROMPT);
     if (confirmed) {
         onConfirm();
     } else {
@@ -41,14 +42,17 @@ function confirmAction(
 }
 export default function SettingsScreen() {
     const navigation = useNavigation<any>();
-    const { user, logout } = useAuthStore();
+    // Subscribe to just these two; login/loading churn elsewhere in the store
+    // shouldn't re-render the settings page
+    const user = useAuthStore((s) => s.user);
+    const logout = useAuthStore((s) => s.logout);
     const [ntfyTopic, setNtfyTopic] = useState(user?.ntfy_topic ?? '');
     const [savingNtfy, setSavingNtfy] = useState(false);
     const [deletingAccount, setDeletingAccount] = useState(false);
 
-    const handleLogout = async () => {
+    const handleLogout = useCallback(async () => {
         await logout();
-    };
+    }, [logout]);
 
     const handleSaveNtfy = async () => {
         setSavingNtfy(true);
@@ -70,29 +74,29 @@ export default function SettingsScreen() {
         }
     };
 
-    const performDelete = async () => {
+    const performDelete = useCallback(async () => {
         setDeletingAccount(true);
+        // Sign out straight away instead of waiting on the server. The request
+        // carries the token read here, so clearing it on logout can't strip it.
+        const token = await getToken();
+        const request = api.delete('/profiles/me', { headers: { Authorization: `Bearer ${token}` } });
+        await logout();
         try {
-            await api.delete('/profiles/me');
-            await logout();
+            await request;
         } catch (err: any) {
             const msg = err?.response?.data?.detail ?? 'Failed to delete account.';
+            const text = `${msg} Sign in again to retry.`;
             if (Platform.OS === 'web') {
-                window.alert(`Error: ${msg}`);
+                window.alert(`Error: ${text}`);
             } else {
-                Alert.alert('Error', msg);
+                Alert.alert('Error', text);
             }
-            setDeletingAccount(false);
         }
-    };
+    }, [logout]);
 
-    const handleDeleteAccount = () => {
-        confirmAction(
-            '⚠️ Delete Account',
-            'This action is permanent and cannot be undone. All your profile data, messages, and account information will be permanently deleted. Are you absolutely sure?',
-            performDelete,
-        );
-    };
+    const handleDeleteAccount = useCallback(() => {
+        confirmDelete(performDelete);
+    }, [performDelete]);
 
     return (
         <SafeAreaView style={styles.container} edges={['top']}>
@@ -103,13 +107,7 @@ export default function SettingsScreen() {
                 {/* Profile summary */}
                 <Card style={styles.profileCard}>
                     <View style={styles.profileRow}>
-                        {user?.avatar_url ? (
-                            <Image source={{ uri: user.avatar_url }} style={styles.avatar} />
-                        ) : (
-                            <View style={styles.avatarFallback}>
-                                <Text style={styles.avatarInitial}>{user?.name?.[0]?.toUpperCase()}</Text>
-                            </View>
-                        )}
+                        <Avatar uri={user?.avatar_url} name={user?.name ?? ''} size={56} />
                         <View>
                             <Text style={styles.userName}>{user?.name}</Text>
                             <Text style={styles.userEmail}>{user?.email}</Text>
@@ -139,7 +137,7 @@ export default function SettingsScreen() {
                         onPress={handleSaveNtfy}
                         loading={savingNtfy}
                         variant="outline"
-                        style={{ marginTop: Spacing.sm }}
+                        style={styles.saveNtfyButton}
                     />
                 </Card>
 
@@ -154,7 +152,7 @@ export default function SettingsScreen() {
                 </Card>
 
                 {/* Delete account */}
-                <Text style={[styles.sectionTitle, { color: Colors.error }]}>Danger Zone</Text>
+                <Text style={[styles.sectionTitle, styles.dangerTitle]}>Danger Zone</Text>
                 <Card style={styles.dangerCard}>
                     <Text style={styles.dangerText}>
                         Permanently delete your account and all associated data. This action cannot be undone.
@@ -164,7 +162,7 @@ export default function SettingsScreen() {
                         onPress={handleDeleteAccount}
                         variant="danger"
                         loading={deletingAccount}
-                        style={{ marginTop: Spacing.md }}
+                        style={styles.deleteButton}
                     />
                 </Card>
             </ScrollView>
@@ -185,16 +183,6 @@ const styles = StyleSheet.create({
     content: { padding: Spacing.md, paddingBottom: Spacing.xxl },
     profileCard: { marginBottom: Spacing.lg },
     profileRow: { flexDirection: 'row', alignItems: 'center', gap: Spacing.md },
-    avatar: { width: 56, height: 56, borderRadius: 28 },
-    avatarFallback: {
-        width: 56,
-        height: 56,
-        borderRadius: 28,
-        backgroundColor: Colors.primary,
-        alignItems: 'center',
-        justifyContent: 'center',
-    },
-    avatarInitial: { color: Colors.white, fontSize: FontSize.xl, fontWeight: '700' },
     userName: { color: Colors.text, fontSize: FontSize.md, fontWeight: '700' },
     userEmail: { color: Colors.textMuted, fontSize: FontSize.sm },
     userProvider: { color: Colors.textMuted, fontSize: FontSize.xs, marginTop: 2 },
@@ -218,6 +206,9 @@ const styles = StyleSheet.create({
         padding: Spacing.sm + 2,
         fontSize: FontSize.md,
     },
+    saveNtfyButton: { marginTop: Spacing.sm },
+    dangerTitle: { color: Colors.error },
     dangerCard: { borderColor: Colors.error },
     dangerText: { color: Colors.textMuted, fontSize: FontSize.sm, lineHeight: 20 },
+    deleteButton: { marginTop: Spacing.md },
 });
@@ -23,8 +23,55 @@ api.interceptors.request.use(async (config) => {
     return config;
 });
 export default api;
+// ── Cached GETs ────────────────────────────────────────────────────────────────
+// Short-lived response cache for reads that screens repeat on every visit.
+// Concurrent callers for the same URL share one in-flight request.
+const CACHE_TTL_MS = 15000;
+const responseCache = new Map<string, { expires: number; data: any }>();
+const inflight = new Map<string, Promise<any>>();
+// Bumped whenever the signed-in account changes; responses from an older
+// generation are never cached or handed to callers of the new session
+let cacheGeneration = 0;
+function resetCache(): void {
+    cacheGeneration++;
+    responseCache.clear();
+    inflight.clear();
+}
+export function cachedGet<T = any>(url: string, ttlMs: number = CACHE_TTL_MS): Promise<T> {
+    const hit = responseCache.get(url);
+    if (hit && hit.expires > Date.now()) return Promise.resolve(hit.data);
+    const pending = inflight.get(url);
+    if (pending) return pending;
+    const generation = cacheGeneration;
+    const request: Promise<T> = api.get(url).then((res) => {
+        // Signed in or out meanwhile: the data belongs to the previous account
+        if (generation !== cacheGeneration) return cachedGet<T>(url, ttlMs);
+        // Only cache if no invalidate has dropped this request since it started
+        if (inflight.get(url) === request) {
+            responseCache.set(url, { expires: Date.now() + ttlMs, data: res.data });
+        }
+        return res.data;
+    });
+    const forget = () => {
+        if (inflight.get(url) === request) inflight.delete(url);
+    };
+    request.then(forget, forget);
+    inflight.set(url, request);
+    return request;
+}
+/** Fresh cached data for `url` without issuing a request, or undefined on a miss. */
+export function peekCached<T = any>(url: string): T | undefined {
+    const hit = responseCache.get(url);
+    return hit && hit.expires > Date.now() ? hit.data : undefined;
+}
+export function invalidateCached(url: string): void {
+    responseCache.delete(url);
+    inflight.delete(url);
+}
 // ── Token helpers ──────────────────────────────────────────────────────────────
 export async function saveToken(token: string): Promise<void> {
+    // Cached and in-flight responses belong to whoever was signed in before
+    resetCache();
     if (Platform.OS === 'web') {
         localStorage.setItem('access_token', token);
     } else {
@@ -38,6 +85,7 @@ export async function getToken(): Promise<string | null> {
     return SecureStore.getItemAsync('access_token');
 }
 export async function clearToken(): Promise<void> {
+    resetCache();
     if (Platform.OS === 'web') {
         localStorage.removeItem('access_token');
     } else {
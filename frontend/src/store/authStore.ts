@@ -22,7 +22,7 @@ interface AuthState {
     loginWithEmail: (email: string, password: string) => Promise<void>;
     registerWithEmail: (email: string, password: string, name: string) => Promise<void>;
 }
-export const useAuthStore = create<AuthState>((set) => ({
+export const useAuthStore = create<AuthState>((set, get) => ({
     user: null,
     token: null,
     isLoading: false,
@@ -46,6 +46,8 @@ export const useAuthStore = create<AuthState>((set) => ({
         }
     },
     loginWithEmail: async (email: string, password: string) => {
+        // A double tap lands here before the button re-renders as disabled
+        if (get().isLoading) return;
         set({ isLoading: true, error: null });
         try {
             const res = await api.post('/auth/email/login', { email, password });
@@ -59,6 +61,7 @@ export const useAuthStore = create<AuthState>((set) => ({
         }
     },
     registerWithEmail: async (email: string, password: string, name: string) => {
+        if (get().isLoading) return;
         set({ isLoading: true, error: null });
         try {
             const res = await api.post('/auth/register', { email, password, name });
@@ -0,0 +1,6 @@
+const TAG_RE = /<[^>]+>/g;
+
+/** Drop HTML tags from rich-text answers and schema labels, keeping their text. */
+export function stripHtml(html: string): string {
+    return html.replace(TAG_RE, '');
+}
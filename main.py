@@ -1,13 +1,7 @@
 #!/usr/bin/env python3
 from functools import partial
-from math import log
 import re
-from tkinter.font import names
-from turtle import home, onclick
 from authlib.common.encoding import json_dumps, json_loads
-from click import prompt
-from httpx import delete
-from sympy.abc import F
 from custom_sub_pages import custom_sub_pages, protected 
 from typing import Text, TypedDict
 import random